@@ -15,7 +15,7 @@ from ..core.config import settings
 from ..services.download import fetch_to_wav, cleanup_temp_files
 from ..services.analyze import analyze_audio, Analysis
 from ..services.recommend import recommend_chain, Targets
-from ..services.presets_bridge import PresetsBridge
+from ..services.presets_bridge import presets_bridge
 from ..services.report import generate_mix_report, write_mix_report
 from ..services.zipper import create_preset_zip
 
@@ -97,9 +97,8 @@ async def auto_chain(request: AutoChainRequest, background_tasks: BackgroundTask
         
         # Step 4: Generate presets
         logger.info("Step 4: Generating presets...")
-        bridge = PresetsBridge()
         generated_files = await asyncio.get_event_loop().run_in_executor(
-            executor, bridge.generate_presets, targets, output_dir, uuid_str
+            executor, presets_bridge.generate_presets, targets, output_dir, uuid_str
         )
         
         if not generated_files:
@@ -14,7 +14,7 @@ sys.path.append('/app/backend')
 from app.services.download import fetch_to_wav, cleanup_temp_files
 from app.services.analyze import analyze_audio
 from app.services.recommend import recommend_chain
-from app.services.presets_bridge import PresetsBridge
+from app.services.presets_bridge import presets_bridge
 from app.services.report import generate_mix_report, write_mix_report
 from app.services.zipper import create_preset_zip
 from app.core.config import settings
@@ -93,8 +93,7 @@ async def run_auto_chain(
         
         # Step 4: Generate presets
         logger.info("⚙️  Step 4: Generating presets...")
-        bridge = PresetsBridge()
-        generated_files = bridge.generate_presets(targets, output_dir, uuid_str)
+        generated_files = presets_bridge.generate_presets(targets, output_dir, uuid_str)
         logger.info(f"   ✅ Generated {len(generated_files)} presets")
         
         if not generated_files:
@@ -1,11 +1,29 @@
 """Graillon 3 key-based scale mask generation"""
 import logging
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Note to index mapping
+NOTE_TO_INDEX = {
+    'C': 0, 'C#': 1, 'Db': 1,
+    'D': 2, 'D#': 3, 'Eb': 3,
+    'E': 4,
+    'F': 5, 'F#': 6, 'Gb': 6,
+    'G': 7, 'G#': 8, 'Ab': 8,
+    'A': 9, 'A#': 10, 'Bb': 10,
+    'B': 11
+}
+
+# Scale intervals (semitones from root)
+SCALE_PATTERNS = {
+    'major': (0, 2, 4, 5, 7, 9, 11),     # Major scale
+    'minor': (0, 2, 3, 5, 7, 8, 10)      # Natural minor scale
+}
+
 def scale_mask(tonic: str, mode: str, confidence: float) -> List[int]:
     """
     Generate 12-note scale mask for Graillon 3 based on detected key
@@ -21,31 +39,25 @@ def scale_mask(tonic: str, mode: str, confidence: float) -> List[int]:
     """
     # If confidence is low, use chromatic scale (all notes allowed)
     if confidence < settings.KEY_CONFIDENCE_THRESHOLD:
-        logger.info(f"Key confidence {confidence:.2f} below threshold {settings.KEY_CONFIDENCE_THRESHOLD}, using chromatic scale")
+        logger.info("Key confidence %.2f below threshold %s, using chromatic scale",
+                    confidence, settings.KEY_CONFIDENCE_THRESHOLD)
         return [1] * 12
     
-    # Note to index mapping
-    note_to_index = {
-        'C': 0, 'C#': 1, 'Db': 1,
-        'D': 2, 'D#': 3, 'Eb': 3,
-        'E': 4,
-        'F': 5, 'F#': 6, 'Gb': 6,
-        'G': 7, 'G#': 8, 'Ab': 8,
-        'A': 9, 'A#': 10, 'Bb': 10,
-        'B': 11
-    }
+    mask = list(_scale_mask_for(tonic, mode))
     
-    # Scale intervals (semitones from root)
-    scale_patterns = {
-        'major': [0, 2, 4, 5, 7, 9, 11],     # Major scale
-        'minor': [0, 2, 3, 5, 7, 8, 10]      # Natural minor scale
-    }
+    logger.info("Generated scale mask for %s %s (confidence: %.2f)", tonic, mode, confidence)
+    logger.debug("Scale mask: %s", mask)
     
+    return mask
+
+@lru_cache(maxsize=64)
+def _scale_mask_for(tonic: str, mode: str) -> Tuple[int, ...]:
+    """Scale mask for a tonic/mode pair, cached since only a handful of pairs occur"""
     # Get root note index
-    root_index = note_to_index.get(tonic, 0)  # Default to C if unknown
+    root_index = NOTE_TO_INDEX.get(tonic, 0)  # Default to C if unknown
     
     # Get scale pattern
-    intervals = scale_patterns.get(mode, scale_patterns['major'])  # Default to major
+    intervals = SCALE_PATTERNS.get(mode, SCALE_PATTERNS['major'])  # Default to major
     
     # Generate mask
     mask = [0] * 12
@@ -53,10 +65,7 @@ def scale_mask(tonic: str, mode: str, confidence: float) -> List[int]:
         note_index = (root_index + interval) % 12
         mask[note_index] = 1
     
-    logger.info(f"Generated scale mask for {tonic} {mode} (confidence: {confidence:.2f})")
-    logger.debug(f"Scale mask: {mask}")
-    
-    return mask
+    return tuple(mask)
 
 def get_scale_name(tonic: str, mode: str) -> str:
     """Get human-readable scale name"""
@@ -1,23 +1,129 @@
 """Bridge service to convert targets to .aupreset files using existing generators"""
 import sys
 import os
+import json
+import hashlib
 import logging
+import plistlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Iterator, Optional, Sequence, Tuple
 
-# Add the backend directory to Python path to import existing modules
-sys.path.append('/app/backend')
-from export.au_preset_generator import AUPresetGenerator
+# Make the backend directory importable (for export.*) once, without hard-coding the container path
+_BACKEND_DIR = str(Path(__file__).resolve().parents[2])
+if _BACKEND_DIR not in sys.path:
+    sys.path.append(_BACKEND_DIR)
+from export.au_preset_generator import AUPresetGenerator, au_preset_generator, parse_generated_preset_path
 
 from ..core.config import settings
+from . import presets_converters as converters
 
 logger = logging.getLogger(__name__)
 
+# Professional (param_key, plugin_name) pairs in chain order
+_PROFESSIONAL_PLUGIN_ORDER: Tuple[Tuple[str, str], ...] = (
+    ('MEqualizer', 'MEqualizer'),           # EQ first
+    ('TDR Nova', 'TDR Nova'),               # Dynamic EQ/De-ess
+    ('1176 Compressor', '1176 Compressor'), # Character compression
+    ('Graillon 3', 'Graillon 3'),           # Pitch correction
+    ('LA-LA', 'LA-LA'),                     # Leveling
+    ('Fresh Air', 'Fresh Air'),             # Presence/air
+    ('MCompressor', 'MCompressor'),         # Glue compression (if needed)
+    ('MConvolutionEZ', 'MConvolutionEZ')    # Reverb last
+)
+
+# Legacy target keys mapped to actual plugin names, in chain order
+_LEGACY_PLUGIN_NAMES: Dict[str, str] = {
+    'MEqualizer': 'MEqualizer',           # EQ first
+    'TDRNova': 'TDR Nova',                # Dynamic EQ
+    '1176Compressor': '1176 Compressor',  # Character compression
+    'Graillon3': 'Graillon 3',            # Pitch correction
+    'LALA': 'LA-LA',                      # Leveling
+    'FreshAir': 'Fresh Air',              # Presence/air
+    'MCompressor': 'MCompressor',         # Glue compression
+    'MConvolutionEZ': 'MConvolutionEZ'    # Reverb last
+}
+
+# Legacy (target key, plugin_name) pairs in chain order
+_LEGACY_PLUGIN_ORDER: Tuple[Tuple[str, str], ...] = tuple(_LEGACY_PLUGIN_NAMES.items())
+
+# Bump when converters, seeds or generator output change so stale cached presets are never replayed
+_PRESET_CACHE_VERSION = 1
+_PRESET_CACHE_SIZE = 32
+
+# Upper bound on concurrent per-plugin preset generations (one per chain slot)
+_MAX_GENERATION_WORKERS = 8
+
+# Cached chain: (chain_name it was generated under, ((path relative to presets dir, file bytes), ...))
+CachedPresets = Tuple[str, Tuple[Tuple[str, bytes], ...]]
+
+def _rename_preset(data: bytes, old_chain_name: str, new_chain_name: str) -> bytes:
+    """Point the preset name stored inside an .aupreset plist at the new chain name"""
+    try:
+        preset = plistlib.loads(data)
+    except Exception:
+        return data
+    
+    name = preset.get('name') if isinstance(preset, dict) else None
+    if not isinstance(name, str) or old_chain_name not in name:
+        return data
+    
+    preset['name'] = name.replace(old_chain_name, new_chain_name)
+    fmt = plistlib.FMT_BINARY if data.startswith(b'bplist') else plistlib.FMT_XML
+    return plistlib.dumps(preset, fmt=fmt)
+
 class PresetsBridge:
     """Bridge between recommendation targets and preset generation"""
     
-    def __init__(self):
-        self.generator = AUPresetGenerator()
+    __slots__ = ('generator', '_preset_cache', '_preset_cache_lock')
+    
+    # Converters live in presets_converters as pure functions
+    _convert_graillon3_professional = staticmethod(converters.convert_graillon3_professional)
+    _convert_tdrnova_professional = staticmethod(converters.convert_tdrnova_professional)
+    _convert_1176_professional = staticmethod(converters.convert_1176_professional)
+    _convert_lala_professional = staticmethod(converters.convert_lala_professional)
+    _convert_fresh_air_professional = staticmethod(converters.convert_fresh_air_professional)
+    _convert_convolution_professional = staticmethod(converters.convert_convolution_professional)
+    _convert_mequalizer_professional = staticmethod(converters.convert_mequalizer_professional)
+    _convert_mcompressor_professional = staticmethod(converters.convert_mcompressor_professional)
+    _convert_mequalizer_targets = staticmethod(converters.convert_mequalizer_targets)
+    _convert_tdrnova_targets = staticmethod(converters.convert_tdrnova_targets)
+    _convert_1176_targets = staticmethod(converters.convert_1176_targets)
+    _convert_graillon3_targets = staticmethod(converters.convert_graillon3_targets)
+    _convert_lala_targets = staticmethod(converters.convert_lala_targets)
+    _convert_fresh_air_targets = staticmethod(converters.convert_fresh_air_targets)
+    _convert_mcompressor_targets = staticmethod(converters.convert_mcompressor_targets)
+    _convert_convolution_targets = staticmethod(converters.convert_convolution_targets)
+    
+    # Converter dispatch tables keyed by professional plugin key / legacy target key
+    _PRO_CONVERTERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+        'Graillon 3': converters.convert_graillon3_professional,
+        'TDR Nova': converters.convert_tdrnova_professional,
+        '1176 Compressor': converters.convert_1176_professional,
+        'LA-LA': converters.convert_lala_professional,
+        'Fresh Air': converters.convert_fresh_air_professional,
+        'MConvolutionEZ': converters.convert_convolution_professional,
+        'MEqualizer': converters.convert_mequalizer_professional,
+        'MCompressor': converters.convert_mcompressor_professional
+    }
+    _LEGACY_CONVERTERS: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+        'MEqualizer': converters.convert_mequalizer_targets,
+        'TDRNova': converters.convert_tdrnova_targets,
+        '1176Compressor': converters.convert_1176_targets,
+        'Graillon3': converters.convert_graillon3_targets,
+        'LALA': converters.convert_lala_targets,
+        'FreshAir': converters.convert_fresh_air_targets,
+        'MCompressor': converters.convert_mcompressor_targets,
+        'MConvolutionEZ': converters.convert_convolution_targets
+    }
+    
+    def __init__(self, generator: Optional[AUPresetGenerator] = None):
+        self.generator = generator or AUPresetGenerator()
+        # Recently generated chains keyed by targets hash (LRU, shared across requests)
+        self._preset_cache: "OrderedDict[str, CachedPresets]" = OrderedDict()
+        self._preset_cache_lock = threading.Lock()
         
     def generate_presets(self, targets: Dict[str, Any], output_dir: Path, uuid_str: str) -> List[Path]:
         """
@@ -31,603 +137,282 @@ class PresetsBridge:
         Returns:
             List of generated preset file paths
         """
-        logger.info(f"🎯 PROFESSIONAL PRESETS BRIDGE: Starting generation")
-        logger.info(f"🎯 Available targets: {list(targets.keys())}")
-        
-        # Check if we have professional parameters
-        if 'professional_params' in targets:
-            logger.info("🎯 Using PROFESSIONAL parameter mapping")
-            return self._generate_professional_presets(targets, output_dir, uuid_str)
-        else:
-            logger.info("🎯 Using legacy parameter mapping")
-            return self._generate_legacy_presets(targets, output_dir, uuid_str)
+        return list(self.iter_presets(targets, output_dir, uuid_str))
     
-    def _generate_professional_presets(self, targets: Dict[str, Any], output_dir: Path, uuid_str: str) -> List[Path]:
-        """Generate presets using professional parameter mapping"""
-        
-        # Create presets subdirectory
-        presets_dir = output_dir / "presets"
-        presets_dir.mkdir(parents=True, exist_ok=True)
+    def iter_presets(self, targets: Dict[str, Any], output_dir: Path, uuid_str: str) -> Iterator[Path]:
+        """
+        Yield generated .aupreset files in chain order as soon as each one is ready
         
-        generated_files = []
+        Args:
+            targets: Plugin parameter targets from recommend.py
+            output_dir: Directory to write preset files
+            uuid_str: Unique identifier for this generation
+            
+        Yields:
+            Generated preset file paths
+        """
         chain_style = targets.get('chain_style', 'auto')
-        chain_name = f"AutoChain_{chain_style}_{uuid_str[:8]}"
+        professional = 'professional_params' in targets
+        logger.info(
+            "🎯 PRESETS BRIDGE: Starting generation (style=%s, mode=%s, targets=%s)",
+            chain_style, 'professional' if professional else 'legacy', targets.keys()
+        )
         
-        # Get professional parameters
-        professional_params = targets.get('professional_params', {})
-        
-        # Process plugins in optimal order
-        plugin_order = [
-            ('MEqualizer', 'MEqualizer'),           # EQ first 
-            ('TDR Nova', 'TDR Nova'),             # Dynamic EQ/De-ess
-            ('1176 Compressor', '1176 Compressor'), # Character compression
-            ('Graillon 3', 'Graillon 3'),         # Pitch correction
-            ('LA-LA', 'LA-LA'),                   # Leveling
-            ('Fresh Air', 'Fresh Air'),           # Presence/air
-            ('MCompressor', 'MCompressor'),       # Glue compression (if needed)
-            ('MConvolutionEZ', 'MConvolutionEZ')  # Reverb last
-        ]
-        
-        for i, (param_key, plugin_name) in enumerate(plugin_order, 1):
-            if param_key in professional_params:
-                plugin_targets = professional_params[param_key]
-                logger.info(f"🎯 Processing {param_key} with professional parameters: {list(plugin_targets.keys())}")
-                
-                try:
-                    preset_name = f"{chain_name}_{i:02d}_{plugin_name.replace(' ', '_')}"
-                    
-                    # Convert professional parameters to plugin format
-                    plugin_params = self._convert_professional_params(param_key, plugin_targets)
-                    
-                    if plugin_params:  # Only generate if we have parameters
-                        logger.info(f"🎯 Generating preset for {plugin_name} with {len(plugin_params)} parameters")
-                        
-                        success, stdout, stderr = self.generator.generate_preset(
-                            plugin_name=plugin_name,
-                            parameters=plugin_params,
-                            preset_name=preset_name,
-                            output_dir=str(presets_dir),
-                            verbose=True
-                        )
-                        
-                        if success:
-                            # Find the generated file
-                            preset_files = list(presets_dir.rglob(f"*{preset_name}*.aupreset"))
-                            if preset_files:
-                                generated_files.extend(preset_files)
-                                logger.info(f"✅ Professional preset generated: {plugin_name} -> {preset_files[0].name}")
-                            else:
-                                logger.warning(f"⚠️ {plugin_name} generation succeeded but file not found")
-                        else:
-                            logger.error(f"❌ Failed to generate {plugin_name}: {stderr}")
-                            
-                except Exception as e:
-                    logger.error(f"❌ Exception generating {plugin_name}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
-            else:
-                logger.info(f"⏭️ Skipping {param_key} (not in professional params)")
-        
-        logger.info(f"🎯 PROFESSIONAL PRESETS COMPLETE: Generated {len(generated_files)} preset files")
-        return generated_files
-    
-    def _generate_legacy_presets(self, targets: Dict[str, Any], output_dir: Path, uuid_str: str) -> List[Path]:
-        """Generate presets using legacy parameter mapping (original method)"""
-        logger.info(f"Generating presets for {len(targets)} plugins")
-        
-        # Create presets subdirectory
         presets_dir = output_dir / "presets"
-        presets_dir.mkdir(parents=True, exist_ok=True)
-        
-        generated_files = []
-        chain_name = f"AutoChain_{targets.get('chain_style', 'auto')}_{uuid_str[:8]}"
-        
-        # Process each plugin
-        plugin_order = [
-            'MEqualizer',      # EQ first
-            'TDRNova',        # Dynamic EQ
-            '1176Compressor', # Character compression
-            'Graillon3',      # Pitch correction
-            'LALA',           # Leveling
-            'FreshAir',       # Presence/air
-            'MCompressor',    # Glue compression
-            'MConvolutionEZ'  # Reverb last
-        ]
+        chain_name = f"AutoChain_{chain_style}_{uuid_str[:8]}"
         
-        for i, plugin in enumerate(plugin_order, 1):
-            if plugin in targets and targets[plugin] is not None:
-                logger.info(f"Processing plugin {plugin}, type: {type(targets[plugin])}")
-                try:
-                    preset_name = f"{chain_name}_{i:02d}_{plugin}"
-                    plugin_params = self._convert_targets_to_params(plugin, targets[plugin])
-                    
-                    if plugin_params:  # Only generate if we have parameters
-                        success, stdout, stderr = self.generator.generate_preset(
-                            plugin_name=self._get_plugin_name(plugin),
-                            parameters=plugin_params,
-                            preset_name=preset_name,
-                            output_dir=str(presets_dir),
-                            verbose=True
-                        )
-                        
-                        if success:
-                            # Find the generated file
-                            preset_files = list(presets_dir.rglob(f"*{preset_name}*.aupreset"))
-                            if preset_files:
-                                generated_files.extend(preset_files)
-                                logger.info(f"✅ Generated {plugin}: {preset_files[0].name}")
-                            else:
-                                logger.warning(f"⚠️ {plugin} generation succeeded but file not found")
-                        else:
-                            logger.error(f"❌ Failed to generate {plugin}: {stderr}")
-                            
-                except Exception as e:
-                    logger.error(f"❌ Exception generating {plugin}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
-            else:
-                logger.info(f"⏭️ Skipping {plugin} (not in targets or None)")
+        # Identical targets always produce identical presets - replay them under the new chain name
+        cache_key = self._targets_cache_key(targets)
+        with self._preset_cache_lock:
+            cached = self._preset_cache.get(cache_key)
+            if cached is not None:
+                self._preset_cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.info("🎯 Reusing cached presets for identical targets (%s)", cache_key)
+            yield from self._replay_cached_presets(cached, presets_dir, chain_name)
+            return
         
-        logger.info(f"Generated {len(generated_files)} preset files")
-        return generated_files
+        # Check if we have professional parameters
+        if professional:
+            plugin_targets = targets.get('professional_params', {})
+            converter = self._convert_professional_params
+            plugin_order = _PROFESSIONAL_PLUGIN_ORDER
+        else:
+            plugin_targets = targets
+            converter = self._convert_targets_to_params
+            plugin_order = _LEGACY_PLUGIN_ORDER
+        
+        generated_files: List[Path] = []
+        complete = True
+        for preset_file, ok in self._iter_presets_common(
+            plugin_targets, presets_dir, chain_name, converter, plugin_order
+        ):
+            complete = complete and ok
+            if preset_file is not None:
+                generated_files.append(preset_file)
+                yield preset_file
+        
+        logger.info("🎯 PRESETS COMPLETE: Generated %s preset files", len(generated_files))
+        
+        # Only cache chains where every plugin generated cleanly
+        if complete and generated_files:
+            self._store_cached_presets(cache_key, presets_dir, chain_name, generated_files)
     
-    def _convert_professional_params(self, plugin_key: str, professional_targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert professional parameter mapping to plugin-specific parameters"""
-        
-        logger.info(f"🎯 Converting professional params for {plugin_key}: {professional_targets}")
+    def _iter_presets_common(
+        self,
+        plugin_targets: Dict[str, Any],
+        presets_dir: Path,
+        chain_name: str,
+        converter: Callable[[str, Any], Dict[str, Any]],
+        plugin_order: Sequence[Tuple[str, str]]
+    ) -> Iterator[Tuple[Optional[Path], bool]]:
+        """
+        Generate presets for each (param_key, plugin_name) in plugin_order
         
-        if plugin_key == 'Graillon 3':
-            return self._convert_graillon3_professional(professional_targets)
-        elif plugin_key == 'TDR Nova':
-            return self._convert_tdrnova_professional(professional_targets)
-        elif plugin_key == '1176 Compressor':
-            return self._convert_1176_professional(professional_targets)
-        elif plugin_key == 'LA-LA':
-            return self._convert_lala_professional(professional_targets)
-        elif plugin_key == 'Fresh Air':
-            return self._convert_fresh_air_professional(professional_targets)
-        elif plugin_key == 'MConvolutionEZ':
-            return self._convert_convolution_professional(professional_targets)
-        elif plugin_key == 'MEqualizer':
-            return self._convert_mequalizer_professional(professional_targets)
-        elif plugin_key == 'MCompressor':
-            return self._convert_mcompressor_professional(professional_targets)
-        else:
-            logger.warning(f"Unknown professional plugin: {plugin_key}")
-            return {}
+        Args:
+            plugin_targets: Per-plugin targets keyed by param_key
+            presets_dir: Directory to write preset files
+            chain_name: Prefix for generated preset names
+            converter: Converts (param_key, plugin targets) to plugin parameters
+            plugin_order: Ordered (param_key, plugin_name) pairs
+            
+        Yields:
+            (generated preset file or None, whether the plugin succeeded) per plugin, in chain order
+        """
+        # Resolve the active slots for this chain once; absent plugins never reach the pool
+        active_slots = []
+        for i, (param_key, plugin_name) in enumerate(plugin_order, 1):
+            plugin_config = plugin_targets.get(param_key)
+            if plugin_config is None:
+                logger.debug("⏭️ Skipping %s (not in targets or None)", param_key)
+                continue
+            active_slots.append((i, param_key, plugin_name, plugin_config))
+        
+        # Nothing to generate - don't touch the filesystem
+        if not active_slots:
+            logger.info("🎯 No plugin targets to generate, skipping presets directory")
+            return
+        
+        # Create presets subdirectory - a single mkdir in the common case where output_dir exists
+        try:
+            presets_dir.mkdir()
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            presets_dir.mkdir(parents=True, exist_ok=True)
+        
+        # The Python fallback copies the first .aupreset it finds in presets_dir and
+        # may clean up its Presets/ tree, so it only stays correct one plugin at a time
+        if not self.generator.check_available():
+            for i, param_key, plugin_name, plugin_config in active_slots:
+                yield self._generate_one(
+                    i, param_key, plugin_name, plugin_config, presets_dir, chain_name, converter
+                )
+            return
+        
+        # Plugins are independent, so generate them concurrently; results are
+        # yielded in submission order so the chain order is preserved
+        with ThreadPoolExecutor(max_workers=min(_MAX_GENERATION_WORKERS, len(active_slots))) as executor:
+            futures = [
+                executor.submit(
+                    self._generate_one, i, param_key, plugin_name,
+                    plugin_config, presets_dir, chain_name, converter
+                )
+                for i, param_key, plugin_name, plugin_config in active_slots
+            ]
+            for future in futures:
+                yield future.result()
     
-    def _convert_graillon3_professional(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert professional Graillon 3 parameters using actual parameter names"""
-        params = {
-            'Correction_Amount': targets.get('correction_amount', 0.4),
-            'Smooth': targets.get('correction_speed', 20.0),
-            'Pitch_Shift': 0.0,  # Use correction instead of direct pitch shift
-            'Wet_Mix': 100.0,
-            'Dry_Mix': 0.0,
-            'Correction': True,  # Enable pitch correction
-            'PTM_Enabled': True  # Enable pitch tracking
-        }
+    def _generate_one(
+        self,
+        i: int,
+        param_key: str,
+        plugin_name: str,
+        plugin_config: Any,
+        presets_dir: Path,
+        chain_name: str,
+        converter: Callable[[str, Any], Dict[str, Any]]
+    ) -> Tuple[Optional[Path], bool]:
+        """
+        Generate the preset for a single plugin slot
         
-        # Set scale mask if provided (Allow_C, Allow_Cs, etc.)
-        key = targets.get('key', 'C')
-        if key != 'Chromatic':
-            # Enable only the notes in the key (simplified - just root note for now)
-            note_mapping = {
-                'C': 'Allow_C', 'C#': 'Allow_Cs', 'D': 'Allow_D', 'D#': 'Allow_Ds',
-                'E': 'Allow_E', 'F': 'Allow_F', 'F#': 'Allow_Fs', 'G': 'Allow_G',
-                'G#': 'Allow_Gs', 'A': 'Allow_A', 'A#': 'Allow_As', 'B': 'Allow_B'
-            }
+        Returns:
+            Tuple of (generated preset file or None, whether the plugin succeeded)
+        """
+        logger.info("🎯 Processing %s, type: %s", param_key, type(plugin_config))
+        try:
+            preset_name = f"{chain_name}_{i:02d}_{param_key.replace(' ', '_')}"
+            
+            # Convert targets to plugin format
+            plugin_params = converter(param_key, plugin_config)
+            
+            if not plugin_params:  # Only generate if we have parameters
+                return None, True
+            
+            logger.info("🎯 Generating preset for %s with %s parameters", plugin_name, len(plugin_params))
             
-            # Disable all notes first
-            for note in note_mapping.values():
-                params[note] = False
+            success, stdout, stderr = self.generator.generate_preset(
+                plugin_name=plugin_name,
+                parameters=plugin_params,
+                preset_name=preset_name,
+                output_dir=str(presets_dir),
+                verbose=True
+            )
             
-            # Enable the root note
-            if key in note_mapping:
-                params[note_mapping[key]] = True
+            if not success:
+                logger.error("❌ Failed to generate %s: %s", plugin_name, stderr)
+                return None, False
+            
+            # The generator reports the path it wrote; only search when it doesn't
+            preset_file = parse_generated_preset_path(stdout)
+            if preset_file is None or not preset_file.is_file():
+                preset_files = self._find_preset_files(presets_dir, preset_name)
+                preset_file = preset_files[0] if preset_files else None
+            
+            if preset_file:
+                logger.info("✅ Generated %s: %s", plugin_name, preset_file.name)
+                return preset_file, True
+            
+            logger.warning("⚠️ %s generation succeeded but file not found", plugin_name)
+            return None, False
                 
-        return params
+        except Exception as e:
+            logger.exception("❌ Exception generating %s: %s", plugin_name, e)
+            return None, False
     
-    def _convert_tdrnova_professional(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert professional TDR Nova parameters (keep existing sophisticated logic)"""
-        params = {
-            'bypass': False,
-            'multiband_enabled': targets.get('multiband_enabled', True)
-        }
-        
-        # HPF
-        if 'hpf_freq' in targets:
-            params.update({
-                'crossover_1': targets['hpf_freq'],
-                'band_1_enabled': True
-            })
-        
-        # Mud dip (band 2)
-        if 'mud_center' in targets and 'mud_gain' in targets:
-            params.update({
-                'crossover_2': targets['mud_center'],
-                'band_2_threshold': targets['mud_gain'] + 10,  # Convert gain to threshold
-                'band_2_ratio': 3.0,
-                'band_2_enabled': True
-            })
-        
-        # De-esser (band 4)  
-        if 'deess_center' in targets and 'deess_threshold' in targets:
-            params.update({
-                'crossover_3': targets['deess_center'],
-                'band_4_threshold': targets['deess_threshold'],
-                'band_4_ratio': targets.get('deess_ratio', 2.5),
-                'band_4_enabled': True
-            })
-        
-        return params
+    @staticmethod
+    def _targets_cache_key(targets: Dict[str, Any]) -> str:
+        """Stable hash of the targets (chain_style included, uuid excluded)"""
+        payload = json.dumps(targets, sort_keys=True, default=str)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"v{_PRESET_CACHE_VERSION}:".encode('utf-8'))
+        digest.update(payload.encode('utf-8'))
+        return digest.hexdigest()
     
-    def _convert_1176_professional(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert professional 1176 Compressor parameters using actual parameter names"""
-        
-        # Convert ratio strings to numeric values for the 1176
-        ratio_map = {
-            '4:1': 1.0,
-            '8:1': 2.0, 
-            '12:1': 3.0,
-            '20:1': 4.0
-        }
-        
-        # Convert attack/release to approximate values
-        attack_map = {
-            'Fast': 0.2,
-            'Medium': 0.5,
-            'Slow': 0.8
-        }
-        
-        release_map = {
-            'Fast': 0.2,
-            'Medium': 0.5,
-            'Slow': 0.8
-        }
-        
-        ratio_val = ratio_map.get(targets.get('ratio', '4:1'), 1.0)
-        attack_val = attack_map.get(targets.get('attack', 'Medium'), 0.5)
-        release_val = release_map.get(targets.get('release', 'Medium'), 0.5)
-        
-        return {
-            'Input': 0.5,   # 5dB input gain (normalized 0-1)
-            'Output': 0.3,  # 3dB output gain
-            'Ratio': ratio_val,
-            'Attack': attack_val,
-            'Release': release_val,
-            'Power': True   # Plugin enabled
-        }
+    def _store_cached_presets(self, cache_key: str, presets_dir: Path, chain_name: str, preset_files: List[Path]):
+        """Remember generated preset bytes so identical targets can skip generation"""
+        try:
+            entries = tuple((str(f.relative_to(presets_dir)), f.read_bytes()) for f in preset_files)
+        except (OSError, ValueError) as e:
+            logger.warning("Not caching presets for %s: %s", chain_name, e)
+            return
+        
+        with self._preset_cache_lock:
+            self._preset_cache[cache_key] = (chain_name, entries)
+            self._preset_cache.move_to_end(cache_key)
+            while len(self._preset_cache) > _PRESET_CACHE_SIZE:
+                self._preset_cache.popitem(last=False)
     
-    def _convert_lala_professional(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert professional LA-LA parameters using actual parameter names"""
-        return {
-            'Gain': 0.5,  # Center position
-            'Peak_Reduction': targets.get('peak_reduction', 0.25),  # Already in 0-1 range
-            'Mode': 0.0,  # Normal mode
-            'Bypass': False
-        }
+    @staticmethod
+    def _replay_cached_presets(cached: CachedPresets, presets_dir: Path, chain_name: str) -> List[Path]:
+        """Write cached presets into presets_dir, renamed for the new chain"""
+        cached_chain_name, entries = cached
+        preset_files = []
+        for rel_path, data in entries:
+            preset_file = presets_dir / rel_path.replace(cached_chain_name, chain_name)
+            preset_file.parent.mkdir(parents=True, exist_ok=True)
+            preset_file.write_bytes(_rename_preset(data, cached_chain_name, chain_name))
+            preset_files.append(preset_file)
+        
+        logger.info("🎯 PRESETS COMPLETE: Replayed %s cached preset files", len(preset_files))
+        return preset_files
     
-    def _convert_fresh_air_professional(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert professional Fresh Air parameters using actual parameter names"""
-        return {
-            'Mid_Air': targets.get('mid_air', 0.2),      # Use exact parameter names
-            'High_Air': targets.get('high_air', 0.3),    # Use exact parameter names  
-            'Bypass': False,
-            'Trim': 0.5  # Center trim
-        }
+    @staticmethod
+    def _find_preset_files(presets_dir: Path, preset_name: str) -> List[Path]:
+        """Find generated preset files, checking presets_dir itself before walking subdirectories"""
+        # Python fallback writes directly into presets_dir - a single directory read
+        with os.scandir(presets_dir) as entries:
+            preset_files = [
+                Path(entry.path) for entry in entries
+                if preset_name in entry.name and entry.name.endswith('.aupreset') and entry.is_file()
+            ]
+        if preset_files:
+            return preset_files
+        
+        # Swift CLI nests presets under Presets/<manufacturer>/<plugin>/
+        return list(presets_dir.rglob(f"*{preset_name}*.aupreset"))
     
-    def _convert_convolution_professional(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert professional MConvolutionEZ parameters using actual parameter names"""
-        return {
-            'Dry_Wet': targets.get('mix', 0.12),  # Mix level (0-1)
-            'Widening': 1.0,  # Full stereo width
-            'High_Pass': targets.get('low_cut', 250.0),  # Low cut frequency
-            'Low_Pass': targets.get('hf_damping', 10000.0),  # High cut frequency  
-            'Predelay': targets.get('pre_delay', 25.0),  # Pre-delay in ms
-            'Normalize_IR': True  # Normalize impulse response
-        }
-
-    def _convert_mequalizer_professional(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert professional MEqualizer parameters using actual parameter names from map"""
-        params = {
-            'bypass': False,
-            'Mix': 100.0,  # Full wet
-            'Output_Gain': 0.0,
-            
-            # Band 1: High-pass/Bass cut
-            'Band_1_Enable': True,
-            'Band_1_Frequency': targets.get('bass_cut_freq', 80),
-            'Band_1_Gain': targets.get('bass_cut_gain', -1.0),
-            'Band_1_Q': 0.7,
-            'Band_1_Type': 6,  # High-pass filter type
-            
-            # Band 2: Mud cut
-            'Band_2_Enable': True,
-            'Band_2_Frequency': targets.get('mud_cut_freq', 300),
-            'Band_2_Gain': targets.get('mud_cut_gain', -1.0),
-            'Band_2_Q': 2.0,
-            'Band_2_Type': 0,  # Bell filter type
-            
-            # Band 3: Presence boost  
-            'Band_3_Enable': True,
-            'Band_3_Frequency': targets.get('presence_freq', 3000),
-            'Band_3_Gain': targets.get('presence_gain', 1.2),
-            'Band_3_Q': 1.5,
-            'Band_3_Type': 0,  # Bell filter type
-            
-            # Band 4: Air shelf
-            'Band_4_Enable': True,
-            'Band_4_Frequency': targets.get('air_freq', 11000),
-            'Band_4_Gain': targets.get('air_gain', 1.2),
-            'Band_4_Q': 0.7,
-            'Band_4_Type': 4,  # High-shelf filter type
-            
-            # Disable unused bands
-            'Band_5_Enable': False
-        }
+    def _convert_professional_params(self, plugin_key: str, professional_targets: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert professional parameter mapping to plugin-specific parameters"""
         
-        logger.info(f"🎯 MEqualizer professional params: {len(params)} parameters")
-        return params
-
-    def _convert_mcompressor_professional(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert professional MCompressor parameters using actual parameter names from map"""
-        params = {
-            'bypass': False,
-            'Input_Gain': 0.0,
-            'Output_Gain': targets.get('makeup_gain', 2.0),
-            'Attack': targets.get('attack', 30),  # ms
-            'Release': targets.get('release', 200),  # ms
-            'RMS_Length': 50.0,  # RMS window
-            'Threshold': targets.get('threshold', -8),
-            'Ratio': targets.get('ratio', 2.0),
-            'Knee_Mode': 1,  # Soft knee
-            'Knee_Size': 2.0,
-            'Link_Channels': True,
-            'Maximize_To_0dB': False,
-            'Custom_Shape': 0
-        }
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎯 Converting professional params for %s: %s", plugin_key, professional_targets)
         
-        logger.info(f"🎯 MCompressor professional params: {len(params)} parameters")
-        return params
-
-    def _get_plugin_name(self, target_plugin: str) -> str:
-        """Map target plugin names to actual plugin names"""
-        mapping = {
-            'MEqualizer': 'MEqualizer',
-            'TDRNova': 'TDR Nova',
-            '1176Compressor': '1176 Compressor',
-            'Graillon3': 'Graillon 3',
-            'LALA': 'LA-LA',
-            'FreshAir': 'Fresh Air',
-            'MCompressor': 'MCompressor',
-            'MConvolutionEZ': 'MConvolutionEZ'
-        }
-        return mapping.get(target_plugin, target_plugin)
+        convert = self._PRO_CONVERTERS.get(plugin_key)
+        if convert is None:
+            logger.warning("Unknown professional plugin: %s", plugin_key)
+            return {}
+        return convert(professional_targets)
     
     def _convert_targets_to_params(self, plugin: str, target_config: Dict[str, Any]) -> Dict[str, Any]:
         """Convert recommendation targets to plugin-specific parameters"""
         
-        # Handle different target_config types
-        if isinstance(target_config, list):
+        # Handle different target_config types (exact-type checks first, subclasses still accepted)
+        config_type = type(target_config)
+        if config_type is list or (config_type is not dict and isinstance(target_config, list)):
             # For plugins that return lists (like MEqualizer, TDRNova)
             if not target_config:  # Empty list means disabled
                 return {}
-        elif isinstance(target_config, dict):
+        elif config_type is dict or isinstance(target_config, dict):
             # For plugins that return dicts, check enabled flag
             if not target_config.get('enabled', True):
                 return {}
         else:
             # Unexpected type
-            logger.warning(f"Unexpected target_config type for {plugin}: {type(target_config)}")
+            logger.warning("Unexpected target_config type for %s: %s", plugin, type(target_config))
+            return {}
+        
+        convert = self._LEGACY_CONVERTERS.get(plugin)
+        if convert is None:
+            logger.warning("Unknown plugin: %s", plugin)
             return {}
         
         try:
-            if plugin == 'MEqualizer':
-                return self._convert_mequalizer_targets(target_config)
-            elif plugin == 'TDRNova':
-                return self._convert_tdrnova_targets(target_config)
-            elif plugin == '1176Compressor':
-                return self._convert_1176_targets(target_config)
-            elif plugin == 'Graillon3':
-                return self._convert_graillon3_targets(target_config)
-            elif plugin == 'LALA':
-                return self._convert_lala_targets(target_config)
-            elif plugin == 'FreshAir':
-                return self._convert_fresh_air_targets(target_config)
-            elif plugin == 'MCompressor':
-                return self._convert_mcompressor_targets(target_config)
-            elif plugin == 'MConvolutionEZ':
-                return self._convert_convolution_targets(target_config)
-            else:
-                logger.warning(f"Unknown plugin: {plugin}")
-                return {}
+            return convert(target_config)
                 
         except Exception as e:
-            logger.error(f"Failed to convert targets for {plugin}: {e}")
+            logger.error("Failed to convert targets for %s: %s", plugin, e)
             return {}
-    
-    def _convert_mequalizer_targets(self, targets: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Convert MEqualizer EQ moves to parameters"""
-        params = {
-            'bypass': False,
-        }
-        
-        # Handle case where targets might be a dict instead of list
-        if isinstance(targets, dict):
-            # If it's a dict with enabled=False, return bypass
-            if not targets.get('enabled', True):
-                params['bypass'] = True
-                return params
-            # Otherwise assume it's a single EQ move
-            targets = [targets]
-        
-        # Process each EQ move
-        band_count = 0
-        for i, eq_move in enumerate(targets):
-            if eq_move.get('type') == 'HPF':
-                params.update({
-                    'high_pass_enabled': True,
-                    'high_pass_freq': eq_move['freq'],
-                    'high_pass_q': eq_move.get('Q', 0.7)
-                })
-            elif eq_move.get('type') == 'bell' and band_count < 4:  # Limit to available bands
-                band_num = band_count + 1
-                params.update({
-                    f'band_{band_num}_enabled': True,
-                    f'band_{band_num}_freq': eq_move['freq'],
-                    f'band_{band_num}_gain': eq_move['gain_db'],
-                    f'band_{band_num}_q': eq_move.get('Q', 1.0),
-                    f'band_{band_num}_type': 'bell'
-                })
-                band_count += 1
-        
-        return params
-    
-    def _convert_tdrnova_targets(self, targets: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Convert TDR Nova dynamic EQ moves to parameters"""
-        params = {
-            'bypass': False,
-            'multiband_enabled': False
-        }
-        
-        # Handle case where targets might be a dict instead of list
-        if isinstance(targets, dict):
-            if not targets.get('enabled', True):
-                params['bypass'] = True
-                return params
-            targets = [targets]
-        
-        # Only enable multiband if we have targets
-        if targets and len(targets) > 0:
-            params['multiband_enabled'] = True
-            
-            # Set crossover frequencies for multiband
-            if len(targets) > 1:
-                params.update({
-                    'crossover_1': 250,
-                    'crossover_2': 2000,
-                    'crossover_3': 6000
-                })
-            
-            # Process dynamic bands
-            for i, band in enumerate(targets[:3]):  # Max 3 bands
-                band_num = i + 1
-                params.update({
-                    f'band_{band_num}_threshold': band.get('threshold_db', -20),
-                    f'band_{band_num}_ratio': band.get('ratio', 2.0),
-                    # Additional TDR Nova specific parameters
-                    f'bandActive_{band_num}': True,
-                    f'bandDynActive_{band_num}': True,
-                    f'bandGain_{band_num}': 0.0  # No static gain, just dynamics
-                })
-        
-        return params
-    
-    def _convert_1176_targets(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert 1176 targets to parameters"""
-        # Map ratio strings to values
-        ratio_map = {'2:1': 2, '4:1': 4, '8:1': 8, '12:1': 12, '20:1': 20}
-        ratio_value = ratio_map.get(targets.get('ratio', '4:1'), 4)
-        
-        # Map attack/release strings
-        timing_map = {'fast': 0.1, 'medium': 0.5, 'slow': 0.9}
-        attack_value = timing_map.get(targets.get('attack', 'medium'), 0.5)
-        release_value = timing_map.get(targets.get('release', 'medium'), 0.5)
-        
-        return {
-            'bypass': False,
-            'ratio': ratio_value,
-            'attack': attack_value,
-            'release': release_value,
-            'input_gain': targets.get('input_gain_db', 2),
-            'output_gain': targets.get('output_gain_db', 2),
-            'all_buttons': False
-        }
-    
-    def _convert_graillon3_targets(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert Graillon 3 targets to parameters"""
-        if not targets.get('enabled', False):
-            return {'bypass': True}
-        
-        # Convert scale mask to pitch correction parameters
-        amount = targets.get('amount', 0.5)
-        speed = targets.get('speed', 0.6)
-        
-        # For now, use basic pitch correction parameters
-        # Scale mask would need special handling in preset generation
-        return {
-            'bypass': False,
-            'pitch_shift': 0.0,  # No static pitch shift
-            'formant_shift': 0.0,  # Preserve formants
-            'octave_mix': 0.0,     # No octave effect
-            'bitcrusher': 0.0,     # Clean
-            'mix': amount * 100    # Correction amount as mix
-        }
-    
-    def _convert_lala_targets(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert LA-LA leveling targets to parameters"""
-        target_gr = targets.get('target_gr_db', 2)
-        mode = targets.get('mode', 'medium')
-        
-        # Map target GR to level parameter (0-100 scale)
-        target_level = 50 + (target_gr * 5)  # Rough mapping
-        
-        # Map mode to dynamics setting
-        dynamics_map = {'gentle': 30, 'medium': 50, 'fast': 70}
-        dynamics = dynamics_map.get(mode, 50)
-        
-        return {
-            'bypass': False,
-            'target_level': target_level,
-            'dynamics': dynamics,
-            'fast_release': mode == 'fast'
-        }
-    
-    def _convert_fresh_air_targets(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert Fresh Air targets to parameters"""
-        return {
-            'presence': targets.get('presence', 0.25) * 100,    # Convert to 0-100 scale
-            'brilliance': targets.get('brilliance', 0.15) * 100, # Convert to 0-100 scale
-            'mix': targets.get('mix', 0.8) * 100                 # Convert to 0-100 scale
-        }
-    
-    def _convert_mcompressor_targets(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert MCompressor targets to parameters"""
-        return {
-            'bypass': False,
-            'threshold': -20 + targets.get('target_gr_db', 2),  # Adjust threshold for target GR
-            'ratio': targets.get('ratio', 2.0),
-            'attack': targets.get('attack_ms', 30) / 1000.0,    # Convert ms to seconds
-            'release': targets.get('release_ms', 150) / 1000.0, # Convert ms to seconds
-            'knee': targets.get('knee_db', 3),
-            'makeup_gain': targets.get('target_gr_db', 2) * 0.7  # Partial makeup
-        }
-    
-    def _convert_convolution_targets(self, targets: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert MConvolutionEZ targets to parameters"""
-        # Map IR type to impulse parameter
-        ir_map = {
-            'small_plate': 'Plate',
-            'medium_plate': 'Plate', 
-            'large_plate': 'Plate',
-            'small_hall': 'Hall',
-            'medium_hall': 'Hall',
-            'large_hall': 'Hall',
-            'vintage_plate': 'Vintage'
-        }
-        
-        impulse_type = ir_map.get(targets.get('ir_type', 'medium_plate'), 'Plate')
-        
-        return {
-            'bypass': False,
-            'impulse_type': impulse_type,
-            'decay': 0.8,  # Medium decay
-            'pre_delay': targets.get('pre_delay_ms', 15),
-            'low_cut': 100,   # Standard low cut
-            'high_cut': 8000, # Standard high cut
-            'mix': targets.get('wet', 0.1) * 100,  # Convert to 0-100 scale
-            'width': 1.0      # Full stereo width
-        }
\ No newline at end of file
+
+# Global instance
+presets_bridge = PresetsBridge(au_preset_generator)
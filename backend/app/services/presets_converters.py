@@ -0,0 +1,413 @@
+"""Pure conversions from recommendation targets to plugin-specific preset parameters
+
+Every function here is a stateless Dict -> Dict transform with no I/O, so the
+module can be compiled ahead of time (e.g. `mypyc presets_converters.py`)
+without changing callers.
+"""
+import logging
+from functools import lru_cache, wraps
+from typing import Callable, Dict, List, Any
+
+logger = logging.getLogger(__name__)
+
+_CONVERTER_CACHE_SIZE = 128
+
+def _memoize_targets(func: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Memoize a converter on its (flat) targets dict; unhashable targets bypass the cache"""
+    @lru_cache(maxsize=_CONVERTER_CACHE_SIZE)
+    def cached(key: frozenset) -> Dict[str, Any]:
+        return func({name: value for name, _, value in key})
+    
+    @wraps(func)
+    def wrapper(targets: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            # Value type is part of the key so True/1/1.0 don't share an entry
+            key = frozenset((name, value.__class__, value) for name, value in targets.items())
+        except TypeError:
+            return func(targets)
+        # Callers may mutate the result, so never hand out the cached dict itself
+        return dict(cached(key))
+    
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+# Graillon 3 scale mask parameter per note (Allow_C, Allow_Cs, etc.)
+_GRAILLON_NOTE_MAPPING = {
+    'C': 'Allow_C', 'C#': 'Allow_Cs', 'D': 'Allow_D', 'D#': 'Allow_Ds',
+    'E': 'Allow_E', 'F': 'Allow_F', 'F#': 'Allow_Fs', 'G': 'Allow_G',
+    'G#': 'Allow_Gs', 'A': 'Allow_A', 'A#': 'Allow_As', 'B': 'Allow_B'
+}
+_GRAILLON_NOTE_FLAGS_OFF = dict.fromkeys(_GRAILLON_NOTE_MAPPING.values(), False)
+
+# 1176 ratio strings to normalized ratio knob values (professional mapping)
+_RATIO_MAP_1176_PRO = {
+    '4:1': 1.0,
+    '8:1': 2.0,
+    '12:1': 3.0,
+    '20:1': 4.0
+}
+
+# 1176 attack/release to approximate knob values (professional mapping)
+_TIMING_MAP_1176_PRO = {
+    'Fast': 0.2,
+    'Medium': 0.5,
+    'Slow': 0.8
+}
+
+# 1176 ratio strings and attack/release timings (legacy mapping)
+_RATIO_MAP_1176 = {'2:1': 2, '4:1': 4, '8:1': 8, '12:1': 12, '20:1': 20}
+_TIMING_MAP_1176 = {'fast': 0.1, 'medium': 0.5, 'slow': 0.9}
+
+# LA-LA mode to dynamics setting
+_LALA_DYNAMICS_MAP = {'gentle': 30, 'medium': 50, 'fast': 70}
+
+# MConvolutionEZ IR type to impulse parameter
+_IR_MAP = {
+    'small_plate': 'Plate',
+    'medium_plate': 'Plate',
+    'large_plate': 'Plate',
+    'small_hall': 'Hall',
+    'medium_hall': 'Hall',
+    'large_hall': 'Hall',
+    'vintage_plate': 'Vintage'
+}
+
+@_memoize_targets
+def convert_graillon3_professional(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert professional Graillon 3 parameters using actual parameter names"""
+    g = targets.get
+    params = {
+        'Correction_Amount': g('correction_amount', 0.4),
+        'Smooth': g('correction_speed', 20.0),
+        'Pitch_Shift': 0.0,  # Use correction instead of direct pitch shift
+        'Wet_Mix': 100.0,
+        'Dry_Mix': 0.0,
+        'Correction': True,  # Enable pitch correction
+        'PTM_Enabled': True  # Enable pitch tracking
+    }
+    
+    # Set scale mask if provided (Allow_C, Allow_Cs, etc.)
+    key = g('key', 'C')
+    if key != 'Chromatic':
+        # Enable only the notes in the key (simplified - just root note for now)
+        # Disable all notes first
+        params.update(_GRAILLON_NOTE_FLAGS_OFF)
+        
+        # Enable the root note
+        if key in _GRAILLON_NOTE_MAPPING:
+            params[_GRAILLON_NOTE_MAPPING[key]] = True
+            
+    return params
+
+@_memoize_targets
+def convert_tdrnova_professional(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert professional TDR Nova parameters (keep existing sophisticated logic)"""
+    g = targets.get
+    params = {
+        'bypass': False,
+        'multiband_enabled': g('multiband_enabled', True)
+    }
+    
+    # HPF
+    hpf_freq = g('hpf_freq')
+    if hpf_freq is not None:
+        params['crossover_1'] = hpf_freq
+        params['band_1_enabled'] = True
+    
+    # Mud dip (band 2)
+    mud_center = g('mud_center')
+    mud_gain = g('mud_gain')
+    if mud_center is not None and mud_gain is not None:
+        params['crossover_2'] = mud_center
+        params['band_2_threshold'] = mud_gain + 10  # Convert gain to threshold
+        params['band_2_ratio'] = 3.0
+        params['band_2_enabled'] = True
+    
+    # De-esser (band 4)  
+    deess_center = g('deess_center')
+    deess_threshold = g('deess_threshold')
+    if deess_center is not None and deess_threshold is not None:
+        params['crossover_3'] = deess_center
+        params['band_4_threshold'] = deess_threshold
+        params['band_4_ratio'] = g('deess_ratio', 2.5)
+        params['band_4_enabled'] = True
+    
+    return params
+
+@_memoize_targets
+def convert_1176_professional(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert professional 1176 Compressor parameters using actual parameter names"""
+    g = targets.get
+    ratio_val = _RATIO_MAP_1176_PRO.get(g('ratio', '4:1'), 1.0)
+    attack_val = _TIMING_MAP_1176_PRO.get(g('attack', 'Medium'), 0.5)
+    release_val = _TIMING_MAP_1176_PRO.get(g('release', 'Medium'), 0.5)
+    
+    return {
+        'Input': 0.5,   # 5dB input gain (normalized 0-1)
+        'Output': 0.3,  # 3dB output gain
+        'Ratio': ratio_val,
+        'Attack': attack_val,
+        'Release': release_val,
+        'Power': True   # Plugin enabled
+    }
+
+@_memoize_targets
+def convert_lala_professional(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert professional LA-LA parameters using actual parameter names"""
+    return {
+        'Gain': 0.5,  # Center position
+        'Peak_Reduction': targets.get('peak_reduction', 0.25),  # Already in 0-1 range
+        'Mode': 0.0,  # Normal mode
+        'Bypass': False
+    }
+
+@_memoize_targets
+def convert_fresh_air_professional(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert professional Fresh Air parameters using actual parameter names"""
+    return {
+        'Mid_Air': targets.get('mid_air', 0.2),      # Use exact parameter names
+        'High_Air': targets.get('high_air', 0.3),    # Use exact parameter names  
+        'Bypass': False,
+        'Trim': 0.5  # Center trim
+    }
+
+@_memoize_targets
+def convert_convolution_professional(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert professional MConvolutionEZ parameters using actual parameter names"""
+    g = targets.get
+    return {
+        'Dry_Wet': g('mix', 0.12),  # Mix level (0-1)
+        'Widening': 1.0,  # Full stereo width
+        'High_Pass': g('low_cut', 250.0),  # Low cut frequency
+        'Low_Pass': g('hf_damping', 10000.0),  # High cut frequency  
+        'Predelay': g('pre_delay', 25.0),  # Pre-delay in ms
+        'Normalize_IR': True  # Normalize impulse response
+    }
+
+@_memoize_targets
+def convert_mequalizer_professional(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert professional MEqualizer parameters using actual parameter names from map"""
+    g = targets.get
+    params = {
+        'bypass': False,
+        'Mix': 100.0,  # Full wet
+        'Output_Gain': 0.0,
+        
+        # Band 1: High-pass/Bass cut
+        'Band_1_Enable': True,
+        'Band_1_Frequency': g('bass_cut_freq', 80),
+        'Band_1_Gain': g('bass_cut_gain', -1.0),
+        'Band_1_Q': 0.7,
+        'Band_1_Type': 6,  # High-pass filter type
+        
+        # Band 2: Mud cut
+        'Band_2_Enable': True,
+        'Band_2_Frequency': g('mud_cut_freq', 300),
+        'Band_2_Gain': g('mud_cut_gain', -1.0),
+        'Band_2_Q': 2.0,
+        'Band_2_Type': 0,  # Bell filter type
+        
+        # Band 3: Presence boost  
+        'Band_3_Enable': True,
+        'Band_3_Frequency': g('presence_freq', 3000),
+        'Band_3_Gain': g('presence_gain', 1.2),
+        'Band_3_Q': 1.5,
+        'Band_3_Type': 0,  # Bell filter type
+        
+        # Band 4: Air shelf
+        'Band_4_Enable': True,
+        'Band_4_Frequency': g('air_freq', 11000),
+        'Band_4_Gain': g('air_gain', 1.2),
+        'Band_4_Q': 0.7,
+        'Band_4_Type': 4,  # High-shelf filter type
+        
+        # Disable unused bands
+        'Band_5_Enable': False
+    }
+    
+    logger.info("🎯 MEqualizer professional params: %s parameters", len(params))
+    return params
+
+@_memoize_targets
+def convert_mcompressor_professional(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert professional MCompressor parameters using actual parameter names from map"""
+    g = targets.get
+    params = {
+        'bypass': False,
+        'Input_Gain': 0.0,
+        'Output_Gain': g('makeup_gain', 2.0),
+        'Attack': g('attack', 30),  # ms
+        'Release': g('release', 200),  # ms
+        'RMS_Length': 50.0,  # RMS window
+        'Threshold': g('threshold', -8),
+        'Ratio': g('ratio', 2.0),
+        'Knee_Mode': 1,  # Soft knee
+        'Knee_Size': 2.0,
+        'Link_Channels': True,
+        'Maximize_To_0dB': False,
+        'Custom_Shape': 0
+    }
+    
+    logger.info("🎯 MCompressor professional params: %s parameters", len(params))
+    return params
+
+def convert_mequalizer_targets(targets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert MEqualizer EQ moves to parameters"""
+    params = {
+        'bypass': False,
+    }
+    
+    # Handle case where targets might be a dict instead of list
+    if isinstance(targets, dict):
+        # If it's a dict with enabled=False, return bypass
+        if not targets.get('enabled', True):
+            params['bypass'] = True
+            return params
+        # Otherwise assume it's a single EQ move
+        targets = [targets]
+    
+    # Process each EQ move
+    band_count = 0
+    for i, eq_move in enumerate(targets):
+        if eq_move.get('type') == 'HPF':
+            params['high_pass_enabled'] = True
+            params['high_pass_freq'] = eq_move['freq']
+            params['high_pass_q'] = eq_move.get('Q', 0.7)
+        elif eq_move.get('type') == 'bell' and band_count < 4:  # Limit to available bands
+            band_num = band_count + 1
+            params[f'band_{band_num}_enabled'] = True
+            params[f'band_{band_num}_freq'] = eq_move['freq']
+            params[f'band_{band_num}_gain'] = eq_move['gain_db']
+            params[f'band_{band_num}_q'] = eq_move.get('Q', 1.0)
+            params[f'band_{band_num}_type'] = 'bell'
+            band_count += 1
+    
+    return params
+
+def convert_tdrnova_targets(targets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert TDR Nova dynamic EQ moves to parameters"""
+    params = {
+        'bypass': False,
+        'multiband_enabled': False
+    }
+    
+    # Handle case where targets might be a dict instead of list
+    if isinstance(targets, dict):
+        if not targets.get('enabled', True):
+            params['bypass'] = True
+            return params
+        targets = [targets]
+    
+    # Only enable multiband if we have targets
+    if targets:
+        params['multiband_enabled'] = True
+        
+        # Set crossover frequencies for multiband
+        if len(targets) > 1:
+            params['crossover_1'] = 250
+            params['crossover_2'] = 2000
+            params['crossover_3'] = 6000
+        
+        # Process dynamic bands
+        for i, band in enumerate(targets[:3]):  # Max 3 bands
+            band_num = i + 1
+            params[f'band_{band_num}_threshold'] = band.get('threshold_db', -20)
+            params[f'band_{band_num}_ratio'] = band.get('ratio', 2.0)
+            # Additional TDR Nova specific parameters
+            params[f'bandActive_{band_num}'] = True
+            params[f'bandDynActive_{band_num}'] = True
+            params[f'bandGain_{band_num}'] = 0.0  # No static gain, just dynamics
+    
+    return params
+
+def convert_1176_targets(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert 1176 targets to parameters"""
+    # Map ratio and attack/release strings to values
+    ratio_value = _RATIO_MAP_1176.get(targets.get('ratio', '4:1'), 4)
+    attack_value = _TIMING_MAP_1176.get(targets.get('attack', 'medium'), 0.5)
+    release_value = _TIMING_MAP_1176.get(targets.get('release', 'medium'), 0.5)
+    
+    return {
+        'bypass': False,
+        'ratio': ratio_value,
+        'attack': attack_value,
+        'release': release_value,
+        'input_gain': targets.get('input_gain_db', 2),
+        'output_gain': targets.get('output_gain_db', 2),
+        'all_buttons': False
+    }
+
+def convert_graillon3_targets(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert Graillon 3 targets to parameters"""
+    if not targets.get('enabled', False):
+        return {'bypass': True}
+    
+    # Convert scale mask to pitch correction parameters
+    amount = targets.get('amount', 0.5)
+    speed = targets.get('speed', 0.6)
+    
+    # For now, use basic pitch correction parameters
+    # Scale mask would need special handling in preset generation
+    return {
+        'bypass': False,
+        'pitch_shift': 0.0,  # No static pitch shift
+        'formant_shift': 0.0,  # Preserve formants
+        'octave_mix': 0.0,     # No octave effect
+        'bitcrusher': 0.0,     # Clean
+        'mix': amount * 100    # Correction amount as mix
+    }
+
+def convert_lala_targets(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert LA-LA leveling targets to parameters"""
+    target_gr = targets.get('target_gr_db', 2)
+    mode = targets.get('mode', 'medium')
+    
+    # Map target GR to level parameter (0-100 scale)
+    target_level = 50 + (target_gr * 5)  # Rough mapping
+    
+    # Map mode to dynamics setting
+    dynamics = _LALA_DYNAMICS_MAP.get(mode, 50)
+    
+    return {
+        'bypass': False,
+        'target_level': target_level,
+        'dynamics': dynamics,
+        'fast_release': mode == 'fast'
+    }
+
+def convert_fresh_air_targets(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert Fresh Air targets to parameters"""
+    return {
+        'presence': targets.get('presence', 0.25) * 100,    # Convert to 0-100 scale
+        'brilliance': targets.get('brilliance', 0.15) * 100, # Convert to 0-100 scale
+        'mix': targets.get('mix', 0.8) * 100                 # Convert to 0-100 scale
+    }
+
+def convert_mcompressor_targets(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert MCompressor targets to parameters"""
+    return {
+        'bypass': False,
+        'threshold': -20 + targets.get('target_gr_db', 2),  # Adjust threshold for target GR
+        'ratio': targets.get('ratio', 2.0),
+        'attack': targets.get('attack_ms', 30) / 1000.0,    # Convert ms to seconds
+        'release': targets.get('release_ms', 150) / 1000.0, # Convert ms to seconds
+        'knee': targets.get('knee_db', 3),
+        'makeup_gain': targets.get('target_gr_db', 2) * 0.7  # Partial makeup
+    }
+
+def convert_convolution_targets(targets: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert MConvolutionEZ targets to parameters"""
+    # Map IR type to impulse parameter
+    impulse_type = _IR_MAP.get(targets.get('ir_type', 'medium_plate'), 'Plate')
+    
+    return {
+        'bypass': False,
+        'impulse_type': impulse_type,
+        'decay': 0.8,  # Medium decay
+        'pre_delay': targets.get('pre_delay_ms', 15),
+        'low_cut': 100,   # Standard low cut
+        'high_cut': 8000, # Standard high cut
+        'mix': targets.get('wet', 0.1) * 100,  # Convert to 0-100 scale
+        'width': 1.0      # Full stereo width
+    }
@@ -1,7 +1,10 @@
 """Advanced audio analysis to plugin parameter recommendation service"""
 import logging
-from typing import Dict, List, Any
-import numpy as np
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Final, List, Any, NamedTuple, Optional, Sequence, Tuple
 
 from ..core.config import settings
 from .analyze import Analysis
@@ -12,105 +15,289 @@ logger = logging.getLogger(__name__)
 # Use regular Dict instead of custom class for Pydantic compatibility
 Targets = Dict[str, Any]
 
-# Chain archetype definitions
-CHAIN_ARCHETYPES = {
-    'clean': {
+# Settings snapshot (settings are fixed once the app starts); module globals are much cheaper
+# to read on the hot path than attributes of the Pydantic settings object
+_SIBILANCE_THRESHOLD: Final = settings.SIBILANCE_THRESHOLD
+_MUD_THRESHOLD: Final = settings.MUD_THRESHOLD
+_HARSH_THRESHOLD: Final = settings.HARSH_THRESHOLD
+_HIGH_CREST_THRESHOLD: Final = settings.HIGH_CREST_THRESHOLD
+_QUIET_LUFS_THRESHOLD: Final = settings.QUIET_LUFS_THRESHOLD
+_HEADROOM_DB: Final = settings.HEADROOM_DB
+
+# Analysis fields recommend_chain reads - together they fully determine its output
+_FINGERPRINT_FIELDS: Final = (
+    'bpm', 'lufs_i', 'crest_db', 'spectral_tilt', 'brightness_index',
+    'dynamic_spread', 'reverb_tail_s', 'low_end_dominance'
+)
+_VOCAL_FINGERPRINT_FIELDS: Final = (
+    'f0_median', 'gender_profile', 'sibilance_centroid', 'mud_ratio',
+    'nasal_ratio', 'plosive_index', 'intensity'
+)
+_MISSING: Final = object()
+
+# Shared read-only default for absent nested analysis sections (no per-call {} allocation)
+_EMPTY_MAPPING: Final = MappingProxyType({})
+
+def _clip(value: float, lower: float, upper: float) -> float:
+    """Clamp a scalar to [lower, upper] without going through NumPy"""
+    return lower if value < lower else upper if value > upper else value
+
+# Legacy target keys still read by overrides, the CLI and API clients -> professional plugin name
+LEGACY_PLUGIN_ALIASES: Final[Tuple[Tuple[str, str], ...]] = (
+    ('Graillon3', 'Graillon 3'),
+    ('TDRNova', 'TDR Nova'),
+    ('1176Compressor', '1176 Compressor'),
+    ('LALA', 'LA-LA'),
+    ('FreshAir', 'Fresh Air'),
+    ('MEqualizer', 'MEqualizer'),
+    ('MCompressor', 'MCompressor'),
+    ('MConvolutionEZ', 'MConvolutionEZ'),
+)
+
+# Recent recommendations keyed by analysis fingerprint (LRU, shared across requests)
+_RECOMMEND_CACHE_SIZE: Final = 1024
+_recommend_cache: "OrderedDict[Tuple, Targets]" = OrderedDict()
+_recommend_cache_lock = threading.Lock()
+
+# Chain archetype definitions (read-only)
+CHAIN_ARCHETYPES: Final = MappingProxyType({
+    'clean': MappingProxyType({
         'description': 'Transparent, natural vocal processing',
-        'priority': ['clarity', 'transparency'],
+        'priority': ('clarity', 'transparency'),
         'aggressive_processing': False
-    },
-    'pop-airy': {
+    }),
+    'pop-airy': MappingProxyType({
         'description': 'Bright, commercial pop sound with air and presence',
-        'priority': ['brightness', 'presence', 'commercial'],
+        'priority': ('brightness', 'presence', 'commercial'),
         'aggressive_processing': False
-    },
-    'warm-analog': {
+    }),
+    'warm-analog': MappingProxyType({
         'description': 'Warm, vintage analog character with gentle leveling',
-        'priority': ['warmth', 'vintage', 'smooth'],
+        'priority': ('warmth', 'vintage', 'smooth'),
         'aggressive_processing': False
-    },
-    'aggressive-rap': {
+    }),
+    'aggressive-rap': MappingProxyType({
         'description': 'Punchy, in-your-face rap vocal with tight control',
-        'priority': ['punch', 'control', 'presence'],
+        'priority': ('punch', 'control', 'presence'),
         'aggressive_processing': True
-    },
-    'intimate-rnb': {
+    }),
+    'intimate-rnb': MappingProxyType({
         'description': 'Smooth, intimate R&B vocal with soft dynamics',
-        'priority': ['intimacy', 'smoothness', 'space'],
+        'priority': ('intimacy', 'smoothness', 'space'),
         'aggressive_processing': False
-    }
+    })
+})
+
+# Archetype names in CHAIN_ARCHETYPES order, and their positions in _score_chain_styles results
+CHAIN_STYLE_NAMES: Final[Tuple[str, ...]] = tuple(CHAIN_ARCHETYPES)
+STYLE_IDX: Final[Dict[str, int]] = {style: i for i, style in enumerate(CHAIN_STYLE_NAMES)}
+_CLEAN: Final = STYLE_IDX['clean']
+_POP_AIRY: Final = STYLE_IDX['pop-airy']
+_WARM_ANALOG: Final = STYLE_IDX['warm-analog']
+_AGGRESSIVE_RAP: Final = STYLE_IDX['aggressive-rap']
+_INTIMATE_RNB: Final = STYLE_IDX['intimate-rnb']
+
+# Per-gender / per-style lookup tables for professional_parameter_mapping (defaults at call sites)
+HPF_BASE: Final[Dict[str, int]] = {
+    'male': 75,    # Conservative for male vocals
+    'female': 95   # Higher for female vocals
+}
+TARGET_HF_RATIO: Final[Dict[str, float]] = {'pop-airy': 1.05, 'intimate-rnb': 0.90, 'aggressive-rap': 0.95}
+REVERB_MIX: Final[Dict[str, float]] = {'intimate-rnb': 0.15, 'warm-analog': 0.20, 'aggressive-rap': 0.08}
+AIR_SHELF: Final[Dict[str, Tuple[int, float]]] = {'pop-airy': (10000, 1.8), 'intimate-rnb': (12000, 0.8)}
+ATTACK_1176: Final[Dict[str, str]] = {'intimate-rnb': 'Medium'}  # Preserve natural attack
+FORMANT_PRESERVING_STYLES: Final = frozenset({'intimate-rnb', 'clean'})
+
+# _determine_chain_style score deltas per rule for vocal material, columns in CHAIN_STYLE_NAMES
+# order (clean, pop-airy, warm-analog, aggressive-rap, intimate-rnb)
+_VOCAL_STYLE_RULES: Final[Tuple[Tuple[float, ...], ...]] = (
+    (0.0, 1.0, 0.0, 2.0, 0.0),    # High dynamics suggest aggressive processing
+    (-1.0, 1.0, 0.0, 1.5, 0.0),   # Sibilance issues suggest more controlled processing
+    (0.0, 1.5, 0.0, 1.0, -0.5),   # Muddy low end suggests more surgical approach
+    (0.0, 0.0, 1.5, -1.0, 1.0),   # Harsh frequencies suggest gentler processing
+    (-1.0, 1.0, 0.0, 0.5, 0.0),   # Quiet material benefits from more processing
+    (1.0, 0.0, 0.0, -1.0, 1.5),   # Long reverb tail suggests intimate or clean processing
+    (1.0, 0.0, 0.5, 0.0, 0.0),    # High note stability suggests cleaner processing
+    (0.0, 1.0, 0.0, 0.5, 0.0),    # Poor pitch stability might benefit from correction
+)
+
+# _identify_issues rules, in report order: (value is under 'bands', field, threshold, issue)
+_ISSUE_RULES: Final[Tuple[Tuple[bool, str, float, str], ...]] = (
+    (True, 'sibilance', _SIBILANCE_THRESHOLD, 'excessive_sibilance'),
+    (True, 'mud', _MUD_THRESHOLD, 'muddy_low_mids'),
+    (True, 'harsh', _HARSH_THRESHOLD, 'harsh_mids'),
+    (False, 'crest_db', _HIGH_CREST_THRESHOLD, 'high_dynamics'),
+    (False, 'lufs_i', _QUIET_LUFS_THRESHOLD, 'quiet_level'),
+    (True, 'rumble', 0.15, 'low_end_rumble'),
+)
+
+# Per-style constants for the legacy _recommend_* helpers
+# MEqualizer: styles that get a 3.5 kHz presence boost when the mix isn't already harsh
+_PRESENCE_BOOST_STYLES: Final = frozenset({'pop-airy', 'aggressive-rap'})
+
+class _Comp1176Style(NamedTuple):
+    """1176 settings for a chain style (ratio switches on crest factor)"""
+    ratio_threshold: float
+    ratio_above: str
+    ratio_below: str
+    attack: str
+    release: str
+
+class _ConvolutionStyle(NamedTuple):
+    """MConvolutionEZ settings for a chain style (IR switches on existing reverb tail)"""
+    ir_short_tail: str  # Reverb tail < 0.5s
+    ir_long_tail: str
+    wet: float
+    pre_delay_ms: int
+
+_COMP_1176_PARAMS: Final[Dict[str, _Comp1176Style]] = {
+    'aggressive-rap': _Comp1176Style(15, "8:1", "4:1", "fast", "fast"),
+    'intimate-rnb': _Comp1176Style(12, "4:1", "4:1", "medium", "slow"),
+}
+_COMP_1176_DEFAULT: Final = _Comp1176Style(12, "4:1", "2:1", "medium", "medium")
+# LA-LA: style -> (target_gr_db, mode)
+_LALA_PARAMS: Final[Dict[str, Tuple[int, str]]] = {
+    'warm-analog': (3, 'gentle'),
+    'intimate-rnb': (3, 'gentle'),
+    'aggressive-rap': (2, 'fast'),  # Less leveling, more punch
+}
+_LALA_DEFAULT: Final = (2, 'medium')
+# MCompressor: style -> (ratio, attack_ms, release_ms); None disables glue compression
+_COMP_PARAMS: Final[Dict[str, Optional[Tuple[float, int, int]]]] = {
+    'clean': None,
+    'aggressive-rap': (2.2, 30, 150),
+    'intimate-rnb': (1.8, 50, 200),
 }
+_COMP_DEFAULT: Final = (1.8, 30, 150)
+_CONV_PARAMS: Final[Dict[str, _ConvolutionStyle]] = {
+    'aggressive-rap': _ConvolutionStyle('small_plate', 'small_plate', 0.08, 5),
+    'intimate-rnb': _ConvolutionStyle('small_hall', 'medium_hall', 0.12, 15),
+    'warm-analog': _ConvolutionStyle('vintage_plate', 'vintage_plate', 0.10, 15),
+}
+_CONV_DEFAULT: Final = _ConvolutionStyle('medium_plate', 'medium_plate', 0.10, 15)
+# Fresh Air: style -> (presence, brilliance, reduce for positive spectral tilt)
+_FRESH_AIR_PARAMS: Final[Dict[str, Tuple[float, float, bool]]] = {
+    'pop-airy': (0.4, 0.3, True),
+    'aggressive-rap': (0.3, 0.2, False),
+    'warm-analog': (0.15, 0.1, False),
+}
+_FRESH_AIR_DEFAULT: Final = (0.25, 0.15, False)
+
+class Features(NamedTuple):
+    """Analysis metrics used by the professional mapping, with defaults applied"""
+    bpm: float
+    lufs_i: float
+    crest_db: float
+    spectral_tilt: float
+    brightness_index: float
+    dynamic_spread: float
+    reverb_tail_s: float
+    bands_mud: float
+    f0_median: float
+    gender_profile: str
+    sibilance_centroid: float
+    mud_ratio: float
+    nasal_ratio: float
+    plosive_index: float
+    vocal_intensity: float
+    key_tonic: str
+    key_confidence: float
+
+def _extract_features(analysis: Analysis) -> Features:
+    """Read the professional mapping metrics out of the analysis dict in one pass"""
+    # Analysis is a dictionary; vocal features are nested under 'vocal', key data under 'key'
+    get = analysis.get
+    vocal_get = get('vocal', _EMPTY_MAPPING).get
+    key_data = get('key', _EMPTY_MAPPING)
+    return Features(
+        get('bpm', 120.0),
+        get('lufs_i', -20.0),
+        get('crest_db', 12.0),
+        get('spectral_tilt', -6.0),
+        get('brightness_index', 0.8),
+        get('dynamic_spread', 8.0),
+        get('reverb_tail_s', 1.4),
+        get('bands', _EMPTY_MAPPING).get('mud', 0.3),
+        vocal_get('f0_median', 180.0),
+        vocal_get('gender_profile', 'unknown'),
+        vocal_get('sibilance_centroid', 6500.0),
+        vocal_get('mud_ratio', 0.3),
+        vocal_get('nasal_ratio', 0.5),
+        vocal_get('plosive_index', 0.2),
+        vocal_get('intensity', 0.6),
+        key_data.get('tonic', 'C'),
+        key_data.get('confidence', 0.5)
+    )
 
-def professional_parameter_mapping(analysis: Analysis, chain_style: str = 'balanced') -> Targets:
+def professional_parameter_mapping(features: Features, chain_style: str = 'balanced') -> Targets:
     """
     Professional parameter mapping based on detailed audio analysis
-    Converts enhanced analysis into optimal plugin parameters
+    Converts enhanced analysis features (see _extract_features) into optimal plugin parameters
+    
+    Results are memoized on (features, chain_style); callers always get their own copy.
     """
-    logger.info(f"🎯 PROFESSIONAL PARAMETER MAPPING: Starting for chain style '{chain_style}'")
-    
-    # Analysis is a dictionary, not an object with attributes
-    audio_features = analysis  # The analysis dict contains all the audio features
-    vocal_features = analysis.get('vocal', {})  # Vocal features are nested under 'vocal' key
-    
-    # Extract key analysis metrics
-    bpm = audio_features.get('bpm', 120.0)
-    key_data = audio_features.get('key', {})
-    estimated_key = key_data.get('tonic', 'C')
-    key_confidence = key_data.get('confidence', 0.5)
-    
-    lufs_i = audio_features.get('lufs_i', -20.0)
-    crest_db = audio_features.get('crest_db', 12.0)
-    spectral_tilt = audio_features.get('spectral_tilt', -6.0)
-    brightness_index = audio_features.get('brightness_index', 0.8)
-    dynamic_spread = audio_features.get('dynamic_spread', 8.0)
-    
-    # Vocal characteristics
-    f0_median = vocal_features.get('f0_median', 180.0)
-    gender_profile = vocal_features.get('gender_profile', 'unknown')
-    sibilance_centroid = vocal_features.get('sibilance_centroid', 6500.0)
-    mud_ratio = vocal_features.get('mud_ratio', 0.3)
-    nasal_ratio = vocal_features.get('nasal_ratio', 0.5)
-    plosive_index = vocal_features.get('plosive_index', 0.2)
-    vocal_intensity = vocal_features.get('intensity', 0.6)
-    
-    logger.info(f"🎯 Analysis Summary: BPM={bpm:.1f}, Key={estimated_key}, F0={f0_median:.0f}Hz, Crest={crest_db:.1f}dB")
+    # Value type is part of the key so e.g. 1 and 1.0 don't share an entry
+    key = tuple((value.__class__, value) for value in features)
+    try:
+        hash(key)
+    except TypeError:
+        return _map_professional_parameters(features, chain_style)
+    return _copy_targets(_cached_parameter_mapping(key, chain_style), {})
+
+@lru_cache(maxsize=512)
+def _cached_parameter_mapping(key: Tuple[Tuple[type, Any], ...], chain_style: str) -> Targets:
+    """Shared mapping result for professional_parameter_mapping - never hand this out directly"""
+    return _map_professional_parameters(Features(*(value for _, value in key)), chain_style)
+
+def _map_professional_parameters(features: Features, chain_style: str) -> Targets:
+    """Compute the professional plugin parameters (uncached)"""
+    logger.info("🎯 PROFESSIONAL PARAMETER MAPPING: Starting for chain style '%s'", chain_style)
+    
+    # Key analysis metrics and vocal characteristics (extracted once by recommend_chain)
+    (
+        bpm, lufs_i, crest_db, spectral_tilt, brightness_index, dynamic_spread,
+        reverb_tail_s, bands_mud, f0_median, gender_profile, sibilance_centroid,
+        mud_ratio, nasal_ratio, plosive_index, vocal_intensity, estimated_key, key_confidence
+    ) = features
+    # Resolve the style checks used across several plugin sections once
+    is_aggressive_rap = chain_style == 'aggressive-rap'
+    
+    logger.info("🎯 Analysis Summary: BPM=%.1f, Key=%s, F0=%.0fHz, Crest=%.1fdB", bpm, estimated_key, f0_median, crest_db)
     
     # A. GRAILLON 3 (TUNING) PARAMETERS
     logger.info("🎯 Mapping Graillon 3 parameters...")
     
     # Key/Scale mapping
     graillon_key = estimated_key if key_confidence > 0.6 else 'Chromatic'
+    # Chromatic mode needs no mask; otherwise scale_mask serves it from its per-key cache
+    graillon_mask = scale_mask(estimated_key, 'major', key_confidence) if graillon_key != 'Chromatic' else None
     
     # Enhanced correction amount based on vocal type and analysis
-    if chain_style in ['aggressive-rap'] or vocal_intensity > 0.8:
+    if is_aggressive_rap or vocal_intensity > 0.8:
         # Rap/spoken style - minimal correction to preserve character
-        correction_amount = np.clip(0.02 + (plosive_index * 0.08), 0.02, 0.12)
+        correction_amount = _clip(0.02 + (plosive_index * 0.08), 0.02, 0.12)
     else:
         # Pop/R&B sung style - moderate correction based on pitch stability
         base_correction = 0.30 if gender_profile == 'female' else 0.40
         # Increase if crest factor high (indicates pitch instability)
         pitch_instability_factor = max(0, (crest_db - 10) * 0.015)
-        correction_amount = np.clip(base_correction + pitch_instability_factor, 0.25, 0.50)
+        correction_amount = _clip(base_correction + pitch_instability_factor, 0.25, 0.50)
     
     # Correction speed based on musical timing
-    note_16th_ms = (60 / bpm) * 1000 / 4  # 1/16 note in ms
+    beat_ms = (60 / bpm) * 1000  # Quarter note in ms - the only division by bpm
+    note_16th_ms = beat_ms * 0.25  # 1/16 note in ms
     # Slightly faster for pop (more responsive), slower for ballads (more natural)
     speed_multiplier = 0.7 if bpm > 120 else 0.9
-    correction_speed = np.clip(note_16th_ms * speed_multiplier, 8, 50)
+    correction_speed = _clip(note_16th_ms * speed_multiplier, 8.0, 50.0)
     
     # Formant preservation - important for natural sound
-    preserve_formants = True if chain_style in ['intimate-rnb', 'clean'] else False
+    preserve_formants = chain_style in FORMANT_PRESERVING_STYLES
     
     # B. TDR NOVA (SUBTRACTIVE EQ + DYNAMIC DE-ESS) PARAMETERS  
     logger.info("🎯 Mapping TDR Nova parameters...")
     
     # Enhanced HPF based on F0 and mix considerations
-    if gender_profile == 'male':
-        hpf_base = 75  # Conservative for male vocals
-    elif gender_profile == 'female':
-        hpf_base = 95  # Higher for female vocals
-    else:
-        hpf_base = 85  # Safe middle ground
+    hpf_base = HPF_BASE.get(gender_profile, 85)  # Safe middle ground when unknown
     
     # Adjust for plosives and low-end buildup
     if plosive_index > 0.25:
@@ -121,17 +308,17 @@ def professional_parameter_mapping(analysis: Analysis, chain_style: str = 'balan
     # Enhanced mud/low-mid management (200-500 Hz)
     mud_center = 280 + (mud_ratio * 180)  # More precise centering
     mud_excess_db = max(0, (mud_ratio - 0.3) * 15)  # Threshold raised
-    mud_gain = -np.clip(mud_excess_db * 0.6, 0, 3.5)  # More conservative cuts
+    mud_gain = -_clip(mud_excess_db * 0.6, 0.0, 3.5)  # More conservative cuts
     mud_q = 0.8 + (mud_excess_db * 0.12)  # Wider Q for more natural sound
     
     # Enhanced nasal management (800-1800 Hz) 
     nasal_center = 1000 + (nasal_ratio * 800)  # More targeted
     nasal_excess = max(0, nasal_ratio - 0.45)  # Higher threshold
-    nasal_gain = -np.clip(nasal_excess * 5, 0.5, 2.5) if nasal_excess > 0 else 0  # Gentler cuts
+    nasal_gain = -_clip(nasal_excess * 5, 0.5, 2.5) if nasal_excess > 0 else 0  # Gentler cuts
     nasal_q = 1.2  # Slightly wider for musicality
     
     # Professional dynamic de-esser with frequency-dependent settings
-    deess_center = max(5500, min(sibilance_centroid, 9000))  # Clamp to reasonable range
+    deess_center = _clip(sibilance_centroid, 5500, 9000)  # Clamp to reasonable range
     deess_q = 2.5 if sibilance_centroid > 7000 else 2.0  # Tighter for high sibilance
     
     # Adaptive de-essing based on vocal characteristics
@@ -150,33 +337,20 @@ def professional_parameter_mapping(analysis: Analysis, chain_style: str = 'balan
     logger.info("🎯 Mapping 1176 Compressor parameters...")
     
     # Intelligent 1176 usage based on material characteristics
-    use_1176 = crest_db > 9 or vocal_intensity > 0.5 or chain_style == 'aggressive-rap'
-    
-    # Professional ratio selection based on genre and dynamics
-    if chain_style == 'aggressive-rap':
-        if crest_db > 15:
-            ratio_1176 = '8:1'  # Heavy limiting for wild dynamics
-        elif crest_db > 12:
-            ratio_1176 = '4:1'  # Standard rap compression
-        else:
-            ratio_1176 = '4:1'  # Consistent punch
-    elif chain_style == 'intimate-rnb':
-        ratio_1176 = '4:1'  # Musical compression
-    elif chain_style == 'pop-airy':
-        ratio_1176 = '4:1' if crest_db > 12 else '4:1'  # Consistent pop sound
-    else:  # clean, warm-analog
-        ratio_1176 = '4:1'  # Transparent compression
+    use_1176 = crest_db > 9 or vocal_intensity > 0.5 or is_aggressive_rap
+    
+    # Professional ratio selection based on genre and dynamics: 4:1 everywhere
+    # (musical/consistent/transparent), heavy limiting only for wild rap dynamics
+    ratio_1176 = '8:1' if is_aggressive_rap and crest_db > 15 else '4:1'
     
     # Attack timing - critical for vocal character
     if plosive_index > 0.4:
         attack_1176 = 'Fast'  # Catch aggressive transients
-    elif chain_style == 'intimate-rnb':
-        attack_1176 = 'Medium'  # Preserve natural attack
     else:
-        attack_1176 = 'Medium-Fast'  # Balanced response
+        attack_1176 = ATTACK_1176.get(chain_style, 'Medium-Fast')  # Balanced response by default
     
     # Release timing based on tempo and style
-    if chain_style == 'aggressive-rap':
+    if is_aggressive_rap:
         release_1176 = 'Fast'  # Punchy, tight release
     elif bpm > 120:
         release_1176 = 'Medium'  # Musical for uptempo
@@ -213,22 +387,15 @@ def professional_parameter_mapping(analysis: Analysis, chain_style: str = 'balan
     logger.info("🎯 Mapping Fresh Air parameters...")
     
     # Desired HF target based on genre
-    if chain_style == 'pop-airy':
-        target_hf_ratio = 1.05
-    elif chain_style == 'intimate-rnb':
-        target_hf_ratio = 0.90
-    elif chain_style == 'aggressive-rap':
-        target_hf_ratio = 0.95
-    else:
-        target_hf_ratio = 1.0
+    target_hf_ratio = TARGET_HF_RATIO.get(chain_style, 1.0)
     
     # Calculate brightness gap
     hf_gap = target_hf_ratio - brightness_index
     
     # Mid Air and High Air settings
     if hf_gap > 0:
-        mid_air = np.clip(0.15 + hf_gap * 0.4, 0.15, 0.35)
-        high_air = np.clip(0.20 + hf_gap * 0.5, 0.20, 0.45)
+        mid_air = _clip(0.15 + hf_gap * 0.4, 0.15, 0.35)
+        high_air = _clip(0.20 + hf_gap * 0.5, 0.20, 0.45)
     else:
         mid_air = 0.10
         high_air = 0.15
@@ -242,14 +409,7 @@ def professional_parameter_mapping(analysis: Analysis, chain_style: str = 'balan
     logger.info("🎯 Mapping MConvolutionEZ parameters...")
     
     # Reverb amount based on genre and vocal delivery
-    if chain_style == 'intimate-rnb':
-        reverb_mix = 0.15
-    elif chain_style == 'warm-analog':
-        reverb_mix = 0.20
-    elif chain_style == 'aggressive-rap':
-        reverb_mix = 0.08
-    else:
-        reverb_mix = 0.12
+    reverb_mix = REVERB_MIX.get(chain_style, 0.12)
     
     # Reverb decay time based on song BPM
     if bpm > 130:
@@ -257,10 +417,10 @@ def professional_parameter_mapping(analysis: Analysis, chain_style: str = 'balan
     elif bpm < 80:
         reverb_decay = 2.5  # Longer for ballads
     else:
-        reverb_decay = audio_features.get('reverb_tail_s', 1.4) * 1.1  # Based on detected tail
+        reverb_decay = reverb_tail_s * 1.1  # Based on detected tail
     
     # Pre-delay based on BPM
-    pre_delay = np.clip((60 / bpm) * 1000 / 8, 15, 40)  # 1/8 note, 15-40ms range
+    pre_delay = _clip(beat_ms * 0.125, 15.0, 40.0)  # 15-40ms range
     
     # HF damping based on brightness
     if brightness_index > 0.9:
@@ -272,7 +432,7 @@ def professional_parameter_mapping(analysis: Analysis, chain_style: str = 'balan
     logger.info("🎯 Mapping MEqualizer parameters...")
     
     # Bass control based on mud ratio
-    if audio_features.get('bands', {}).get('mud', 0.3) > 0.35:
+    if bands_mud > 0.35:
         bass_cut_freq = 100
         bass_cut_gain = -2.5
         mud_cut_freq = 300
@@ -294,16 +454,8 @@ def professional_parameter_mapping(analysis: Analysis, chain_style: str = 'balan
         presence_freq = 3000
         presence_gain = 1.2
     
-    # Air shelf based on chain style
-    if chain_style == 'pop-airy':
-        air_freq = 10000
-        air_gain = 1.8
-    elif chain_style == 'intimate-rnb':
-        air_freq = 12000
-        air_gain = 0.8
-    else:
-        air_freq = 11000
-        air_gain = 1.2
+    # Air shelf (freq, gain) based on chain style
+    air_freq, air_gain = AIR_SHELF.get(chain_style, (11000, 1.2))
     
     # H. MCOMPRESSOR (GLUE COMPRESSION) PARAMETERS
     logger.info("🎯 Mapping MCompressor parameters...")
@@ -323,9 +475,6 @@ def professional_parameter_mapping(analysis: Analysis, chain_style: str = 'balan
     # Makeup gain to maintain loudness
     comp_makeup = abs(comp_threshold) * (comp_ratio - 1) / comp_ratio * 0.7
     
-    # F. MCONVOLUTIONEZ (REVERB) PARAMETERS
-    logger.info("🎯 Mapping MConvolutionEZ parameters...")
-    
     logger.info("🎯 PARAMETER MAPPING COMPLETE - Generating plugin targets...")
     
     # Generate plugin targets with mapped parameters and summaries
@@ -335,7 +484,7 @@ def professional_parameter_mapping(analysis: Analysis, chain_style: str = 'balan
             'correction_amount': correction_amount,
             'correction_speed': correction_speed,
             'preserve_formants': preserve_formants,
-            'scale_mask': scale_mask(estimated_key, 'major', key_confidence) if graillon_key != 'Chromatic' else None,
+            'scale_mask': graillon_mask,
             'enabled': True,
             'summary': f"Correction: {correction_amount*100:.0f}%, Speed: {correction_speed:.0f}ms, Key: {graillon_key}",
             'reasoning': f"Pitch correction optimized for {gender_profile} vocal in {estimated_key}"
@@ -410,41 +559,13 @@ def professional_parameter_mapping(analysis: Analysis, chain_style: str = 'balan
         }
     }
     
-    logger.info(f"🎯 Generated {len(targets)} plugin parameter sets")
-    for plugin, params in targets.items():
-        logger.info(f"   {plugin}: {len(params)} parameters")
+    logger.info("🎯 Generated %d plugin parameter sets", len(targets))
+    if logger.isEnabledFor(logging.DEBUG):
+        for plugin, params in targets.items():
+            logger.debug("   %s: %d parameters", plugin, len(params))
     
     return targets
 
-# Chain archetype definitions
-CHAIN_ARCHETYPES = {
-    'clean': {
-        'description': 'Transparent, natural vocal processing',
-        'priority': ['clarity', 'transparency'],
-        'aggressive_processing': False
-    },
-    'pop-airy': {
-        'description': 'Bright, commercial pop sound with air and presence',
-        'priority': ['brightness', 'presence', 'commercial'],
-        'aggressive_processing': False
-    },
-    'warm-analog': {
-        'description': 'Warm, vintage analog character with gentle leveling',
-        'priority': ['warmth', 'vintage', 'smooth'],
-        'aggressive_processing': False
-    },
-    'aggressive-rap': {
-        'description': 'Punchy, in-your-face rap vocal with tight control',
-        'priority': ['punch', 'control', 'presence'],
-        'aggressive_processing': True
-    },
-    'intimate-rnb': {
-        'description': 'Smooth, intimate R&B vocal with soft dynamics',
-        'priority': ['intimacy', 'smoothness', 'space'],
-        'aggressive_processing': False
-    }
-}
-
 def recommend_chain(analysis: Analysis) -> Targets:
     """
     Generate professional plugin parameter targets based on enhanced audio analysis
@@ -455,38 +576,122 @@ def recommend_chain(analysis: Analysis) -> Targets:
     Returns:
         Targets dictionary with professional plugin parameters and chain style
     """
+    fingerprint = _analysis_fingerprint(analysis)
+    if fingerprint is not None:
+        with _recommend_cache_lock:
+            cached = _recommend_cache.get(fingerprint)
+            if cached is not None:
+                _recommend_cache.move_to_end(fingerprint)
+        if cached is not None:
+            logger.info("🎯 Reusing cached chain recommendation for identical analysis")
+            # Callers mutate targets, so never hand out the cached dict itself
+            return _copy_targets(cached, {})
+    
+    targets = _build_chain_recommendation(analysis)
+    
+    if fingerprint is not None:
+        with _recommend_cache_lock:
+            _recommend_cache[fingerprint] = _copy_targets(targets, {})
+            while len(_recommend_cache) > _RECOMMEND_CACHE_SIZE:
+                _recommend_cache.popitem(last=False)
+    
+    return targets
+
+def recommend_chain_batch(analyses: Sequence[Analysis]) -> List[Targets]:
+    """
+    Generate chain recommendations for several analyses (e.g. a playlist or library scan)
+    
+    Identical analyses in the batch are computed once and handed out as independent copies.
+    """
+    results: List[Targets] = []
+    batch_results: Dict[Tuple, Targets] = {}
+    for analysis in analyses:
+        fingerprint = _analysis_fingerprint(analysis)
+        if fingerprint is None:
+            results.append(recommend_chain(analysis))
+            continue
+        
+        computed = batch_results.get(fingerprint)
+        if computed is None:
+            computed = batch_results[fingerprint] = recommend_chain(analysis)
+            results.append(computed)
+        else:
+            results.append(_copy_targets(computed, {}))
+    
+    logger.info("🎯 Batch recommendation: %d analyses, %d distinct", len(results), len(batch_results))
+    return results
+
+def _copy_targets(value: Any, memo: Dict[int, Any]) -> Any:
+    """
+    Copy a targets structure (nested dicts/lists of scalars) for the recommendation cache
+    
+    Much cheaper than copy.deepcopy for this shape; shared sub-dicts (e.g. the legacy
+    plugin aliases of professional_params entries) stay shared in the copy.
+    """
+    value_type = type(value)
+    if value_type is not dict and value_type is not list:
+        return value  # Scalars and strings are immutable
+    
+    copied = memo.get(id(value))
+    if copied is None:
+        if value_type is dict:
+            copied = {key: _copy_targets(item, memo) for key, item in value.items()}
+        else:
+            copied = [_copy_targets(item, memo) for item in value]
+        memo[id(value)] = copied
+    return copied
+
+def _analysis_fingerprint(analysis: Analysis) -> Optional[Tuple]:
+    """Hashable key over every analysis field recommend_chain reads, or None if a value isn't hashable"""
+    vocal = analysis.get('vocal', _EMPTY_MAPPING)
+    key_data = analysis.get('key', _EMPTY_MAPPING)
+    values = (
+        tuple(analysis.get(field, _MISSING) for field in _FINGERPRINT_FIELDS)
+        + tuple(vocal.get(field, _MISSING) for field in _VOCAL_FINGERPRINT_FIELDS)
+        + (
+            key_data.get('tonic', _MISSING),
+            key_data.get('confidence', _MISSING),
+            analysis.get('bands', _EMPTY_MAPPING).get('mud', _MISSING)
+        )
+    )
+    # Value type is part of the key so e.g. 1 and 1.0 (or a NumPy float) don't share an entry
+    fingerprint = tuple((value.__class__, value) for value in values)
+    try:
+        hash(fingerprint)
+    except TypeError:
+        return None
+    return fingerprint
+
+def _build_chain_recommendation(analysis: Analysis) -> Targets:
+    """Compute the chain recommendation for recommend_chain (uncached)"""
     logger.info("🎯 STARTING PROFESSIONAL CHAIN RECOMMENDATION")
     
     # Determine chain archetype using enhanced analysis
-    chain_style = _determine_chain_style_professional(analysis)
-    logger.info(f"🎯 Selected professional chain style: {chain_style}")
+    features = _extract_features(analysis)
+    chain_style = _determine_chain_style_professional(features)
+    logger.info("🎯 Selected professional chain style: %s", chain_style)
     
     # Use professional parameter mapping
-    professional_targets = professional_parameter_mapping(analysis, chain_style)
+    professional_targets = professional_parameter_mapping(features, chain_style)
+    
+    vocal = analysis.get('vocal', _EMPTY_MAPPING)
     
     # Create comprehensive targets with both professional and legacy formats
     targets = {
         'chain_style': chain_style,
-        'analysis_summary': _create_analysis_summary_professional(analysis),
+        'analysis_summary': _create_analysis_summary_professional(analysis, features),
         'professional_params': professional_targets,  # New professional parameters
-        'headroom_db': settings.HEADROOM_DB,
+        'headroom_db': _HEADROOM_DB,
         
-        # Legacy plugin names for compatibility with existing system
-        'Graillon3': professional_targets.get('Graillon 3', {}),
-        'TDRNova': professional_targets.get('TDR Nova', {}),
-        '1176Compressor': professional_targets.get('1176 Compressor', {}),
-        'LALA': professional_targets.get('LA-LA', {}),
-        'FreshAir': professional_targets.get('Fresh Air', {}),
-        'MEqualizer': professional_targets.get('MEqualizer', {}),
-        'MCompressor': professional_targets.get('MCompressor', {}),
-        'MConvolutionEZ': professional_targets.get('MConvolutionEZ', {}),
+        # Legacy plugin names for compatibility with existing system (aliases, not copies)
+        **{legacy: professional_targets[name] for legacy, name in LEGACY_PLUGIN_ALIASES},
         
         # Add enhanced analysis data
         'enhanced_analysis': {
             'spectral_tilt': analysis.get('spectral_tilt'),
             'brightness_index': analysis.get('brightness_index'),
-            'vocal_f0': analysis.get('vocal', {}).get('f0_median'),
-            'sibilance_freq': analysis.get('vocal', {}).get('sibilance_centroid'),
+            'vocal_f0': vocal.get('f0_median'),
+            'sibilance_freq': vocal.get('sibilance_centroid'),
             'recommendation_confidence': _calculate_recommendation_confidence(analysis)
         }
     }
@@ -494,94 +699,107 @@ def recommend_chain(analysis: Analysis) -> Targets:
     logger.info("🎯 PROFESSIONAL CHAIN RECOMMENDATION COMPLETE")
     return targets
 
-def _determine_chain_style_professional(analysis: Analysis) -> str:
+def _determine_chain_style_professional(features: Features) -> str:
     """Determine the best chain archetype based on enhanced professional analysis"""
     
-    # Analysis is a dictionary, not an object with attributes
-    audio_features = analysis  # The analysis dict contains all the audio features
-    vocal_features = analysis.get('vocal', {})  # Vocal features are nested under 'vocal' key
+    scores = _score_chain_styles(
+        features.bpm, features.lufs_i, features.brightness_index, features.spectral_tilt,
+        features.crest_db, features.dynamic_spread, features.f0_median,
+        features.vocal_intensity, features.sibilance_centroid, features.plosive_index
+    )
     
-    # Extract enhanced metrics
-    bpm = audio_features.get('bpm', 120.0)
-    lufs_i = audio_features.get('lufs_i', -20.0)
-    brightness_index = audio_features.get('brightness_index', 0.8)
-    spectral_tilt = audio_features.get('spectral_tilt', -6.0)
-    crest_db = audio_features.get('crest_db', 12.0)
-    dynamic_spread = audio_features.get('dynamic_spread', 8.0)
+    # Select highest scoring archetype (first one wins ties)
+    best_style = CHAIN_STYLE_NAMES[scores.index(max(scores))]
     
-    f0_median = vocal_features.get('f0_median', 180.0)
-    vocal_intensity = vocal_features.get('intensity', 0.6)
-    sibilance_centroid = vocal_features.get('sibilance_centroid', 6500.0)
-    plosive_index = vocal_features.get('plosive_index', 0.2)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("🎯 Professional archetype scores: %s", dict(zip(CHAIN_STYLE_NAMES, scores)))
+        logger.info("🎯 Selected: %s", best_style)
     
-    # Professional archetype scoring
-    scores = {style: 0.0 for style in CHAIN_ARCHETYPES.keys()}
+    return best_style
+
+@lru_cache(maxsize=512)
+def _score_chain_styles(
+    bpm: float, lufs_i: float, brightness_index: float, spectral_tilt: float,
+    crest_db: float, dynamic_spread: float, f0_median: float, vocal_intensity: float,
+    sibilance_centroid: float, plosive_index: float
+) -> Tuple[float, ...]:
+    """
+    Professional archetype scores, indexed like CHAIN_STYLE_NAMES
+    
+    Plain floats in, plain floats out (no dicts or strings) so the scoring can be
+    JIT-compiled (e.g. numba.njit) as-is if it ever shows up in profiles. Results are
+    memoized (hence the immutable tuple) since similar mixes repeat the same inputs.
+    """
+    scores = [0.0] * len(CHAIN_STYLE_NAMES)
+    
+    # Each rule adds its weight times a 0/1 condition (& doesn't short-circuit),
+    # so the scoring is straight-line arithmetic with no data-dependent branches
     
     # High energy aggressive style
-    if bpm > 130 and lufs_i > -15 and vocal_intensity > 0.7:
-        scores['aggressive-rap'] += 3.0
-    if crest_db > 14 and plosive_index > 0.3:
-        scores['aggressive-rap'] += 2.0
-        
-    # Intimate R&B style  
-    if bpm < 90 and vocal_intensity < 0.5 and f0_median > 180:
-        scores['intimate-rnb'] += 3.0
-    if dynamic_spread < 6 and spectral_tilt < -8:
-        scores['intimate-rnb'] += 2.0
-        
+    scores[_AGGRESSIVE_RAP] = (
+        3.0 * ((bpm > 130) & (lufs_i > -15) & (vocal_intensity > 0.7))
+        + 2.0 * ((crest_db > 14) & (plosive_index > 0.3))
+    )
+    
+    # Intimate R&B style
+    scores[_INTIMATE_RNB] = (
+        3.0 * ((bpm < 90) & (vocal_intensity < 0.5) & (f0_median > 180))
+        + 2.0 * ((dynamic_spread < 6) & (spectral_tilt < -8))
+    )
+    
     # Pop airy style
-    if brightness_index > 1.0 and spectral_tilt > -4:
-        scores['pop-airy'] += 2.5
-    if sibilance_centroid > 7000 and bpm > 100 and bpm < 140:
-        scores['pop-airy'] += 2.0
-        
-    # Warm analog style
-    if brightness_index < 0.7 and spectral_tilt < -8:
-        scores['warm-analog'] += 2.5
-    if crest_db < 10 and vocal_intensity > 0.4:
-        scores['warm-analog'] += 1.5
-        
-    # Clean style (fallback)
-    scores['clean'] += 1.0  # Base score
+    scores[_POP_AIRY] = (
+        2.5 * ((brightness_index > 1.0) & (spectral_tilt > -4))
+        + 2.0 * ((sibilance_centroid > 7000) & (bpm > 100) & (bpm < 140))
+    )
     
-    # Select highest scoring archetype
-    best_style = max(scores.items(), key=lambda x: x[1])[0]
+    # Warm analog style
+    scores[_WARM_ANALOG] = (
+        2.5 * ((brightness_index < 0.7) & (spectral_tilt < -8))
+        + 1.5 * ((crest_db < 10) & (vocal_intensity > 0.4))
+    )
     
-    logger.info(f"🎯 Professional archetype scores: {scores}")
-    logger.info(f"🎯 Selected: {best_style}")
+    # Clean style (fallback)
+    scores[_CLEAN] = 1.0  # Base score
     
-    return best_style
+    return tuple(scores)
 
-def _create_analysis_summary_professional(analysis: Analysis) -> Dict[str, Any]:
-    """Create professional analysis summary with enhanced metrics"""
+def _create_analysis_summary_professional(analysis: Analysis, features: Features) -> Dict[str, Any]:
+    """
+    Create professional analysis summary with enhanced metrics
     
-    # Analysis is a dictionary, not an object with attributes
-    audio = analysis  # The analysis dict contains all the audio features
-    vocal = analysis.get('vocal', {})  # Vocal features are nested under 'vocal' key
+    Reported values are the raw analysis fields (None when missing); the processing-needs
+    checks reuse the already-extracted features, whose defaults give the same answers.
+    """
+    
+    # Analysis is a dictionary; vocal features are nested under 'vocal', key data under 'key'
+    audio_get = analysis.get
+    vocal_get = audio_get('vocal', _EMPTY_MAPPING).get
+    key_data = audio_get('key', _EMPTY_MAPPING)
     
     return {
-        'tempo': audio.get('bpm'),
-        'key': audio.get('key', {}).get('tonic', 'Unknown'),
-        'key_confidence': audio.get('key', {}).get('confidence', 0.0),
-        'loudness_lufs': audio.get('lufs_i'),
-        'dynamic_range': audio.get('dynamic_spread'),
+        'tempo': audio_get('bpm'),
+        'key': key_data.get('tonic', 'Unknown'),
+        'key_confidence': key_data.get('confidence', 0.0),
+        'loudness_lufs': audio_get('lufs_i'),
+        'dynamic_range': audio_get('dynamic_spread'),
         'spectral_character': {
-            'tilt_db': audio.get('spectral_tilt'),
-            'brightness': audio.get('brightness_index'),
-            'low_end_dominance': audio.get('low_end_dominance')
+            'tilt_db': audio_get('spectral_tilt'),
+            'brightness': audio_get('brightness_index'),
+            'low_end_dominance': audio_get('low_end_dominance')
         },
         'vocal_character': {
-            'f0_hz': vocal.get('f0_median'),
-            'gender_profile': vocal.get('gender_profile'),
-            'sibilance_freq': vocal.get('sibilance_centroid'),
-            'mud_ratio': vocal.get('mud_ratio'),
-            'intensity': vocal.get('intensity')
+            'f0_hz': vocal_get('f0_median'),
+            'gender_profile': vocal_get('gender_profile'),
+            'sibilance_freq': vocal_get('sibilance_centroid'),
+            'mud_ratio': vocal_get('mud_ratio'),
+            'intensity': vocal_get('intensity')
         },
         'processing_needs': {
-            'mud_control': vocal.get('mud_ratio', 0) > 0.35,
-            'sibilance_control': vocal.get('sibilance_centroid', 6500) > 7000,
-            'plosive_control': vocal.get('plosive_index', 0) > 0.3,
-            'brightness_needed': audio.get('brightness_index', 0.8) < 0.7
+            'mud_control': features.mud_ratio > 0.35,
+            'sibilance_control': features.sibilance_centroid > 7000,
+            'plosive_control': features.plosive_index > 0.3,
+            'brightness_needed': features.brightness_index < 0.7
         }
     }
 
@@ -591,19 +809,19 @@ def _calculate_recommendation_confidence(analysis: Analysis) -> float:
     confidence = 0.5  # Base confidence
     
     # Boost confidence based on analysis quality
-    # Analysis is a dictionary, not an object with attributes
-    audio = analysis  # The analysis dict contains all the audio features
-    vocal = analysis.get('vocal', {})  # Vocal features are nested under 'vocal' key
+    # Analysis is a dictionary; vocal features are nested under 'vocal'
+    audio_get = analysis.get
+    vocal_get = audio_get('vocal', _EMPTY_MAPPING).get
     
-    if audio.get('key', {}).get('confidence', 0) > 0.7:
+    if audio_get('key', _EMPTY_MAPPING).get('confidence', 0) > 0.7:
         confidence += 0.1
-    if vocal.get('intensity', 0) > 0.6:
+    if vocal_get('intensity', 0) > 0.6:
         confidence += 0.1
-    if vocal.get('f0_median', 0) > 0:
+    if vocal_get('f0_median', 0) > 0:
         confidence += 0.1
-    if audio.get('brightness_index', 0) > 0:
+    if audio_get('brightness_index', 0) > 0:
         confidence += 0.1
-    if audio.get('spectral_tilt', 0) != 0:
+    if audio_get('spectral_tilt', 0) != 0:
         confidence += 0.1
         
     return min(confidence, 0.95)
@@ -611,66 +829,52 @@ def _calculate_recommendation_confidence(analysis: Analysis) -> float:
 def _determine_chain_style(analysis: Analysis) -> str:
     """Determine the best chain archetype based on analysis"""
     
-    # Scoring system for each archetype
-    scores = {style: 0.0 for style in CHAIN_ARCHETYPES.keys()}
-    
     # Vocal presence affects all decisions
-    if not analysis['vocal']['present']:
-        # For non-vocal material, prefer clean processing
-        scores['clean'] += 2.0
-        scores['warm-analog'] += 1.0
-        return max(scores, key=scores.get)
-    
-    # High dynamics suggest aggressive processing
-    if analysis['crest_db'] > settings.HIGH_CREST_THRESHOLD:
-        scores['aggressive-rap'] += 2.0
-        scores['pop-airy'] += 1.0
-    
-    # Sibilance issues suggest more controlled processing
-    if analysis['bands']['sibilance'] > settings.SIBILANCE_THRESHOLD:
-        scores['aggressive-rap'] += 1.5
-        scores['pop-airy'] += 1.0
-        scores['clean'] -= 1.0  # Clean might not handle sibilance well
-    
-    # Muddy low end suggests more surgical approach
-    if analysis['bands']['mud'] > settings.MUD_THRESHOLD:
-        scores['pop-airy'] += 1.5
-        scores['aggressive-rap'] += 1.0
-        scores['intimate-rnb'] -= 0.5
-    
-    # Harsh frequencies suggest gentler processing
-    if analysis['bands']['harsh'] > settings.HARSH_THRESHOLD:
-        scores['warm-analog'] += 1.5
-        scores['intimate-rnb'] += 1.0
-        scores['aggressive-rap'] -= 1.0
-    
-    # Quiet material benefits from more processing
-    if analysis['lufs_i'] > settings.QUIET_LUFS_THRESHOLD:
-        scores['pop-airy'] += 1.0
-        scores['aggressive-rap'] += 0.5
-        scores['clean'] -= 1.0
-    
-    # Long reverb tail suggests intimate or clean processing
-    if analysis['reverb_tail_s'] > 1.0:
-        scores['intimate-rnb'] += 1.5
-        scores['clean'] += 1.0
-        scores['aggressive-rap'] -= 1.0
-    
-    # High note stability suggests cleaner processing
-    if analysis['vocal']['note_stability'] > 0.7:
-        scores['clean'] += 1.0
-        scores['warm-analog'] += 0.5
-    else:
-        # Poor pitch stability might benefit from correction
-        scores['pop-airy'] += 1.0
-        scores['aggressive-rap'] += 0.5
+    vocal = analysis['vocal']
+    if not vocal['present']:
+        # For non-vocal material, prefer clean processing (clean 2.0 beats warm-analog 1.0)
+        return 'clean'
+    
+    bands = analysis['bands']
+    return _score_vocal_chain_style(
+        analysis['crest_db'], bands['sibilance'], bands['mud'], bands['harsh'],
+        analysis['lufs_i'], analysis['reverb_tail_s'], vocal['note_stability']
+    )
+
+@lru_cache(maxsize=512)
+def _score_vocal_chain_style(
+    crest_db: float, sibilance: float, mud: float, harsh: float,
+    lufs_i: float, reverb_tail_s: float, note_stability: float
+) -> str:
+    """Chain archetype for vocal material, memoized on the metrics _determine_chain_style reads"""
+    
+    # Which _VOCAL_STYLE_RULES rows apply, in table order
+    stable_pitch = note_stability > 0.7
+    fired = (
+        crest_db > _HIGH_CREST_THRESHOLD,
+        sibilance > _SIBILANCE_THRESHOLD,
+        mud > _MUD_THRESHOLD,
+        harsh > _HARSH_THRESHOLD,
+        lufs_i > _QUIET_LUFS_THRESHOLD,
+        reverb_tail_s > 1.0,
+        stable_pitch,
+        not stable_pitch
+    )
+    
+    # Scoring system for each archetype
+    scores = [0.0] * len(CHAIN_STYLE_NAMES)
+    for rule_fired, weights in zip(fired, _VOCAL_STYLE_RULES):
+        if rule_fired:
+            for i, weight in enumerate(weights):
+                scores[i] += weight
     
-    return max(scores, key=scores.get)
+    return CHAIN_STYLE_NAMES[scores.index(max(scores))]
 
 def _create_analysis_summary(analysis: Analysis) -> Dict[str, Any]:
     """Create human-readable analysis summary"""
+    key_info = analysis['key']
     return {
-        'key': f"{analysis['key']['tonic']} {analysis['key']['mode']}",
+        'key': f"{key_info['tonic']} {key_info['mode']}",
         'tempo': f"{analysis['bpm']:.0f} BPM",
         'loudness': f"{analysis['lufs_i']:.1f} LUFS",
         'dynamics': f"{analysis['crest_db']:.1f} dB crest factor",
@@ -680,43 +884,41 @@ def _create_analysis_summary(analysis: Analysis) -> Dict[str, Any]:
 
 def _identify_issues(analysis: Analysis) -> List[str]:
     """Identify potential audio issues for processing"""
-    issues = []
-    
-    if analysis['bands']['sibilance'] > settings.SIBILANCE_THRESHOLD:
-        issues.append('excessive_sibilance')
-    if analysis['bands']['mud'] > settings.MUD_THRESHOLD:
-        issues.append('muddy_low_mids')
-    if analysis['bands']['harsh'] > settings.HARSH_THRESHOLD:
-        issues.append('harsh_mids')
-    if analysis['crest_db'] > settings.HIGH_CREST_THRESHOLD:
-        issues.append('high_dynamics')
-    if analysis['lufs_i'] > settings.QUIET_LUFS_THRESHOLD:
-        issues.append('quiet_level')
-    if analysis['bands']['rumble'] > 0.15:
-        issues.append('low_end_rumble')
-    
-    return issues
+    bands = analysis['bands']
+    return [
+        label
+        for in_bands, field, threshold, label in _ISSUE_RULES
+        if (bands if in_bands else analysis)[field] > threshold
+    ]
+
+@lru_cache(maxsize=64)
+def _style_reason(template: str, chain_style: str) -> str:
+    """Format a reason that only depends on the chain style (one string per style)"""
+    return template.format(chain_style)
 
 def _recommend_graillon3(analysis: Analysis) -> Dict[str, Any]:
     """Generate Graillon 3 parameters"""
-    if not analysis['vocal']['present']:
+    vocal = analysis['vocal']
+    if not vocal['present']:
         return {'enabled': False, 'reason': 'No vocal content detected'}
     
     # Enable correction based on note stability
-    note_stability = analysis['vocal']['note_stability']
+    note_stability = vocal['note_stability']
     enable_correction = note_stability < 0.8
     
     # Correction amount based on instability
     amount = 0.3 + (0.4 * (1.0 - note_stability))  # 0.3-0.7 range
-    amount = max(0.0, min(1.0, amount))
+    amount = _clip(amount, 0.0, 1.0)
     
     # Speed based on note stability (more stable = slower correction)
     speed = 0.4 + (0.4 * (1.0 - note_stability))  # 0.4-0.8 range
-    speed = max(0.0, min(1.0, speed))
+    speed = _clip(speed, 0.0, 1.0)
     
     # Generate scale mask
     key_info = analysis['key']
-    mask = scale_mask(key_info['tonic'], key_info['mode'], key_info['confidence'])
+    tonic = key_info['tonic']
+    mode = key_info['mode']
+    mask = scale_mask(tonic, mode, key_info['confidence'])
     
     return {
         'enabled': enable_correction,
@@ -724,18 +926,22 @@ def _recommend_graillon3(analysis: Analysis) -> Dict[str, Any]:
         'speed': speed,
         'scale_mask': mask,
         'formant_correction': True,
-        'reason': f"Note stability: {note_stability:.2f}, Key: {key_info['tonic']} {key_info['mode']}"
+        'reason': f"Note stability: {note_stability:.2f}, Key: {tonic} {mode}"
     }
 
 def _recommend_mequalizer(analysis: Analysis, chain_style: str) -> List[Dict[str, Any]]:
     """Generate MEqualizer EQ moves"""
     eq_moves = []
+    bands = analysis['bands']
+    rumble = bands['rumble']
+    mud = bands['mud']
+    harsh = bands['harsh']
     
     # High-pass filter for rumble and mud
     hpf_freq = 60
-    if analysis['bands']['rumble'] > 0.1:
+    if rumble > 0.1:
         hpf_freq = 80
-    if analysis['bands']['mud'] > settings.MUD_THRESHOLD:
+    if mud > _MUD_THRESHOLD:
         hpf_freq = 100
     
     eq_moves.append({
@@ -743,37 +949,38 @@ def _recommend_mequalizer(analysis: Analysis, chain_style: str) -> List[Dict[str
         'freq': hpf_freq,
         'Q': 0.9,
         'gain_db': 0,
-        'reason': f"Remove rumble/mud (rumble: {analysis['bands']['rumble']:.2f})"
+        'reason': f"Remove rumble/mud (rumble: {rumble:.2f})"
     })
     
     # Mud cut in low mids
-    if analysis['bands']['mud'] > settings.MUD_THRESHOLD:
-        mud_freq = 200 + (100 * (analysis['bands']['mud'] - settings.MUD_THRESHOLD))
-        mud_gain = -2 - (4 * (analysis['bands']['mud'] - settings.MUD_THRESHOLD))
-        mud_gain = max(-6, mud_gain)
+    if mud > _MUD_THRESHOLD:
+        mud_freq = 200 + (100 * (mud - _MUD_THRESHOLD))
+        mud_gain = -2 - (4 * (mud - _MUD_THRESHOLD))
+        mud_gain = mud_gain if mud_gain > -6 else -6
         
         eq_moves.append({
             'type': 'bell',
             'freq': mud_freq,
             'gain_db': mud_gain,
             'Q': 1.2,
-            'reason': f"Cut mud at {mud_freq:.0f}Hz ({analysis['bands']['mud']:.2f})"
+            'reason': f"Cut mud at {mud_freq:.0f}Hz ({mud:.2f})"
         })
     
     # Boxy frequency cut
-    if analysis['bands']['boxy'] > 0.4:
+    boxy = bands['boxy']
+    if boxy > 0.4:
         eq_moves.append({
             'type': 'bell',
             'freq': 350,
             'gain_db': -1.5,
             'Q': 1.0,
-            'reason': f"Reduce boxiness ({analysis['bands']['boxy']:.2f})"
+            'reason': f"Reduce boxiness ({boxy:.2f})"
         })
     
     # Harsh frequency management
-    if analysis['bands']['harsh'] > settings.HARSH_THRESHOLD:
-        harsh_freq = 2500 + (1000 * (analysis['bands']['harsh'] - settings.HARSH_THRESHOLD))
-        harsh_gain = -1 - (3 * (analysis['bands']['harsh'] - settings.HARSH_THRESHOLD))
+    if harsh > _HARSH_THRESHOLD:
+        harsh_freq = 2500 + (1000 * (harsh - _HARSH_THRESHOLD))
+        harsh_gain = -1 - (3 * (harsh - _HARSH_THRESHOLD))
         
         eq_moves.append({
             'type': 'bell',
@@ -784,7 +991,7 @@ def _recommend_mequalizer(analysis: Analysis, chain_style: str) -> List[Dict[str
         })
     
     # Pre-de-ess notch for extreme sibilance
-    if analysis['bands']['sibilance'] > 0.7:
+    if bands['sibilance'] > 0.7:
         eq_moves.append({
             'type': 'bell',
             'freq': 7000,
@@ -794,13 +1001,13 @@ def _recommend_mequalizer(analysis: Analysis, chain_style: str) -> List[Dict[str
         })
     
     # Presence boost for certain chain styles
-    if chain_style in ['pop-airy', 'aggressive-rap'] and analysis['bands']['harsh'] < 0.4:
+    if chain_style in _PRESENCE_BOOST_STYLES and harsh < 0.4:
         eq_moves.append({
             'type': 'bell',
             'freq': 3500,
             'gain_db': 1.5,
             'Q': 1.0,
-            'reason': f"Presence boost for {chain_style} style"
+            'reason': _style_reason("Presence boost for {} style", chain_style)
         })
     
     return eq_moves
@@ -808,21 +1015,25 @@ def _recommend_mequalizer(analysis: Analysis, chain_style: str) -> List[Dict[str
 def _recommend_tdrnova(analysis: Analysis, chain_style: str) -> List[Dict[str, Any]]:
     """Generate TDR Nova dynamic EQ moves"""
     nova_bands = []
+    bands = analysis['bands']
+    level_offset = analysis['lufs_i'] + 23
     
     # De-essing band for sibilance
-    if analysis['bands']['sibilance'] > 0.4 or analysis['vocal']['sibilance_idx'] > 0.05:
-        sib_intensity = max(analysis['bands']['sibilance'], analysis['vocal']['sibilance_idx'])
+    sibilance = bands['sibilance']
+    sibilance_idx = analysis['vocal']['sibilance_idx']
+    if sibilance > 0.4 or sibilance_idx > 0.05:
+        sib_intensity = max(sibilance, sibilance_idx)
         
         # Frequency based on sibilance character
         deess_freq = 7000 + (1500 * sib_intensity)
-        deess_freq = min(9000, deess_freq)
+        deess_freq = deess_freq if deess_freq < 9000 else 9000
         
         # Threshold based on overall level and sibilance intensity
-        threshold = -25 + (analysis['lufs_i'] + 23) + (5 * sib_intensity)
+        threshold = -25 + level_offset + (5 * sib_intensity)
         
         # Ratio based on severity
         ratio = 1.5 + (1.5 * sib_intensity)
-        ratio = min(3.0, ratio)
+        ratio = ratio if ratio < 3.0 else 3.0
         
         nova_bands.append({
             'band': 'deess',
@@ -836,8 +1047,9 @@ def _recommend_tdrnova(analysis: Analysis, chain_style: str) -> List[Dict[str, A
         })
     
     # Dynamic mud control
-    if analysis['bands']['mud'] > 0.7:
-        mud_threshold = -20 + (analysis['lufs_i'] + 23)
+    mud = bands['mud']
+    if mud > 0.7:
+        mud_threshold = -20 + level_offset
         
         nova_bands.append({
             'band': 'mud_control',
@@ -847,12 +1059,13 @@ def _recommend_tdrnova(analysis: Analysis, chain_style: str) -> List[Dict[str, A
             'threshold_db': mud_threshold,
             'attack_ms': 10,
             'release_ms': 200,
-            'reason': f"Dynamic mud control (mud: {analysis['bands']['mud']:.2f})"
+            'reason': f"Dynamic mud control (mud: {mud:.2f})"
         })
     
     # Harsh frequency dynamic control
-    if analysis['bands']['harsh'] > 0.6 and chain_style != 'clean':
-        harsh_threshold = -18 + (analysis['lufs_i'] + 23)
+    harsh = bands['harsh']
+    if harsh > 0.6 and chain_style != 'clean':
+        harsh_threshold = -18 + level_offset
         
         nova_bands.append({
             'band': 'harsh_control',
@@ -862,7 +1075,7 @@ def _recommend_tdrnova(analysis: Analysis, chain_style: str) -> List[Dict[str, A
             'threshold_db': harsh_threshold,
             'attack_ms': 5,
             'release_ms': 150,
-            'reason': f"Dynamic harsh control (harsh: {analysis['bands']['harsh']:.2f})"
+            'reason': f"Dynamic harsh control (harsh: {harsh:.2f})"
         })
     
     return nova_bands
@@ -874,23 +1087,16 @@ def _recommend_1176(analysis: Analysis, chain_style: str) -> Dict[str, Any]:
     
     # Ratio based on dynamics and chain style
     crest = analysis['crest_db']
-    if chain_style == 'aggressive-rap':
-        ratio = "8:1" if crest > 15 else "4:1"
-    elif chain_style == 'intimate-rnb':
-        ratio = "4:1"
-    else:
-        ratio = "4:1" if crest > 12 else "2:1"
+    style = _COMP_1176_PARAMS.get(chain_style, _COMP_1176_DEFAULT)
+    ratio = style.ratio_above if crest > style.ratio_threshold else style.ratio_below
     
     # Attack/Release based on style and dynamics
-    if chain_style == 'aggressive-rap' or crest > settings.HIGH_CREST_THRESHOLD:
+    if crest > _HIGH_CREST_THRESHOLD:
         attack = "fast"
         release = "fast"
-    elif chain_style == 'intimate-rnb':
-        attack = "medium"
-        release = "slow"
     else:
-        attack = "medium"
-        release = "medium"
+        attack = style.attack
+        release = style.release
     
     # Target gain reduction based on dynamics
     if crest > 16:
@@ -914,78 +1120,55 @@ def _recommend_1176(analysis: Analysis, chain_style: str) -> Dict[str, Any]:
 def _recommend_lala(analysis: Analysis, chain_style: str) -> Dict[str, Any]:
     """Generate LA-LA leveling parameters"""
     # LALA for gentle leveling and analog character
-    if chain_style in ['warm-analog', 'intimate-rnb']:
-        target_gr = 3
-        mode = 'gentle'
-    elif chain_style == 'aggressive-rap':
-        target_gr = 2  # Less leveling, more punch
-        mode = 'fast'
-    else:
-        target_gr = 2
-        mode = 'medium'
+    target_gr, mode = _LALA_PARAMS.get(chain_style, _LALA_DEFAULT)
     
     return {
         'enabled': True,
         'target_gr_db': target_gr,
         'mode': mode,
-        'reason': f"Gentle leveling for {chain_style} style"
+        'reason': _style_reason("Gentle leveling for {} style", chain_style)
     }
 
-def _recommend_fresh_air(analysis: Analysis, chain_style: str) -> Dict[str, Any]:
-    """Generate Fresh Air parameters"""
+@lru_cache(maxsize=1024)
+def _fresh_air_amounts(chain_style: str, tilt: float, sibilance: float) -> Tuple[float, float]:
+    """Fresh Air (presence, brilliance) for a style, spectral tilt and sibilance level"""
     # Base amounts on spectral tilt and chain style
-    tilt = analysis['spectral_tilt']
-    
-    if chain_style == 'pop-airy':
-        presence = 0.4 - (0.2 * max(0, tilt))  # Less if already bright
-        brilliance = 0.3 - (0.15 * max(0, tilt))
-    elif chain_style == 'aggressive-rap':
-        presence = 0.3
-        brilliance = 0.2
-    elif chain_style == 'warm-analog':
-        presence = 0.15
-        brilliance = 0.1
-    else:
-        presence = 0.25
-        brilliance = 0.15
+    presence, brilliance, tilt_scale = _FRESH_AIR_PARAMS.get(chain_style, _FRESH_AIR_DEFAULT)
+    if tilt_scale and tilt > 0:
+        # Less if already bright
+        presence -= 0.2 * tilt
+        brilliance -= 0.15 * tilt
     
     # Cap based on sibilance
-    if analysis['bands']['sibilance'] > settings.SIBILANCE_THRESHOLD:
-        sib_factor = analysis['bands']['sibilance'] / settings.SIBILANCE_THRESHOLD
-        presence *= (1.0 / sib_factor)
-        brilliance *= (1.0 / sib_factor)
+    if sibilance > _SIBILANCE_THRESHOLD:
+        sib_scale = 1.0 / (sibilance / _SIBILANCE_THRESHOLD)
+        presence *= sib_scale
+        brilliance *= sib_scale
     
     # Ensure reasonable ranges
-    presence = max(0.0, min(0.5, presence))
-    brilliance = max(0.0, min(0.4, brilliance))
+    return _clip(presence, 0.0, 0.5), _clip(brilliance, 0.0, 0.4)
+
+def _recommend_fresh_air(analysis: Analysis, chain_style: str) -> Dict[str, Any]:
+    """Generate Fresh Air parameters"""
+    tilt = analysis['spectral_tilt']
+    sibilance = analysis['bands']['sibilance']
+    presence, brilliance = _fresh_air_amounts(chain_style, tilt, sibilance)
     
     return {
         'enabled': presence > 0.05 or brilliance > 0.05,
         'presence': presence,
         'brilliance': brilliance,
         'mix': 0.8,
-        'reason': f"Tilt: {tilt:.2f}, Sibilance: {analysis['bands']['sibilance']:.2f}"
+        'reason': f"Tilt: {tilt:.2f}, Sibilance: {sibilance:.2f}"
     }
 
 def _recommend_mcompressor(analysis: Analysis, chain_style: str) -> Dict[str, Any]:
     """Generate MCompressor glue compression parameters"""
-    # Gentle glue compression
-    if chain_style == 'clean':
+    # Gentle glue compression - ratio and timing by style
+    params = _COMP_PARAMS.get(chain_style, _COMP_DEFAULT)
+    if params is None:
         return {'enabled': False, 'reason': 'Clean chain - no glue compression'}
-    
-    # Ratio based on style
-    if chain_style == 'aggressive-rap':
-        ratio = 2.2
-    else:
-        ratio = 1.8
-    
-    # Timing based on material and style
-    if chain_style == 'intimate-rnb':
-        attack_ms = 50
-        release_ms = 200
-    else:
-        attack_ms = 30
-        release_ms = 150
+    ratio, attack_ms, release_ms = params
     
     return {
         'enabled': True,
@@ -994,37 +1177,22 @@ def _recommend_mcompressor(analysis: Analysis, chain_style: str) -> Dict[str, An
         'release_ms': release_ms,
         'knee_db': 3,
         'target_gr_db': 2,
-        'reason': f"Glue compression for {chain_style} cohesion"
+        'reason': _style_reason("Glue compression for {} cohesion", chain_style)
     }
 
 def _recommend_convolution(analysis: Analysis, chain_style: str) -> Dict[str, Any]:
     """Generate MConvolutionEZ reverb parameters"""
-    # IR selection based on style and reverb tail
+    # IR selection, wet amount and pre-delay based on style and reverb tail
     reverb_tail = analysis['reverb_tail_s']
-    
-    if chain_style == 'aggressive-rap':
-        ir_type = 'small_plate'
-        wet = 0.08
-    elif chain_style == 'intimate-rnb':
-        ir_type = 'small_hall' if reverb_tail < 0.5 else 'medium_hall'
-        wet = 0.12
-    elif chain_style == 'warm-analog':
-        ir_type = 'vintage_plate'
-        wet = 0.10
-    else:
-        ir_type = 'medium_plate'
-        wet = 0.10
+    style = _CONV_PARAMS.get(chain_style, _CONV_DEFAULT)
+    ir_type = style.ir_short_tail if reverb_tail < 0.5 else style.ir_long_tail
+    wet = style.wet
+    pre_delay_ms = style.pre_delay_ms
     
     # Adjust wet amount based on existing reverb
     if reverb_tail > 1.0:
         wet *= 0.7  # Less reverb if already reverberant
     
-    # Pre-delay based on style
-    if chain_style == 'aggressive-rap':
-        pre_delay_ms = 5
-    else:
-        pre_delay_ms = 15
-    
     return {
         'enabled': True,
         'ir_type': ir_type,
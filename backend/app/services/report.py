@@ -1,6 +1,7 @@
 """Mix report generation service"""
 import json
 import logging
+from bisect import bisect_right
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
@@ -8,8 +9,23 @@ from datetime import datetime
 from ..core.config import settings
 from .analyze import Analysis
 
+try:
+    import orjson  # Optional fast JSON encoder; stdlib json is used when it isn't installed
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Category boundaries (ascending, each an exclusive upper bound) and their labels
+_TEMPO_THRESHOLDS = (80, 120, 140)
+_TEMPO_LABELS = ('slow', 'moderate', 'upbeat', 'fast')
+_LOUDNESS_THRESHOLDS = (-23, -18, -14, -10)
+_LOUDNESS_LABELS = ('very_quiet', 'quiet', 'moderate', 'loud', 'very_loud')
+_DYNAMICS_THRESHOLDS = (6, 10, 15, 20)
+_DYNAMICS_LABELS = ('heavily_compressed', 'compressed', 'moderate', 'dynamic', 'very_dynamic')
+_REVERB_THRESHOLDS = (0.3, 0.8, 1.5, 3.0)
+_REVERB_LABELS = ('dry', 'short', 'medium', 'long', 'very_long')
+
 def generate_mix_report(
     analysis: Analysis,
     targets: Dict[str, Any],
@@ -110,8 +126,16 @@ def write_mix_report(report: Dict[str, Any], output_dir: Path) -> Path:
     """Write mix report to JSON file"""
     report_path = output_dir / "mix_report.json"
     
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # Same 2-space layout and UTF-8 output as the json.dump fallback
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(
+                report,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ))
+    else:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
     
     logger.info(f"Mix report written to: {report_path}")
     return report_path
@@ -135,53 +159,19 @@ def _normalize_analysis_metrics(analysis: Analysis) -> Dict[str, Any]:
 
 def _categorize_tempo(bpm: float) -> str:
     """Categorize tempo"""
-    if bpm < 80:
-        return 'slow'
-    elif bpm < 120:
-        return 'moderate'
-    elif bpm < 140:
-        return 'upbeat'
-    else:
-        return 'fast'
+    return _TEMPO_LABELS[bisect_right(_TEMPO_THRESHOLDS, bpm)]
 
 def _categorize_loudness(lufs: float) -> str:
     """Categorize loudness level"""
-    if lufs < -23:
-        return 'very_quiet'
-    elif lufs < -18:
-        return 'quiet'
-    elif lufs < -14:
-        return 'moderate'
-    elif lufs < -10:
-        return 'loud'
-    else:
-        return 'very_loud'
+    return _LOUDNESS_LABELS[bisect_right(_LOUDNESS_THRESHOLDS, lufs)]
 
 def _categorize_dynamics(crest_db: float) -> str:
     """Categorize dynamic range"""
-    if crest_db < 6:
-        return 'heavily_compressed'
-    elif crest_db < 10:
-        return 'compressed'
-    elif crest_db < 15:
-        return 'moderate'
-    elif crest_db < 20:
-        return 'dynamic'
-    else:
-        return 'very_dynamic'
+    return _DYNAMICS_LABELS[bisect_right(_DYNAMICS_THRESHOLDS, crest_db)]
 
 def _categorize_reverb(reverb_s: float) -> str:
     """Categorize reverb tail length"""
-    if reverb_s < 0.3:
-        return 'dry'
-    elif reverb_s < 0.8:
-        return 'short'
-    elif reverb_s < 1.5:
-        return 'medium'
-    elif reverb_s < 3.0:
-        return 'long'
-    else:
-        return 'very_long'
+    return _REVERB_LABELS[bisect_right(_REVERB_THRESHOLDS, reverb_s)]
 
 def _categorize_vocal_quality(vocal: Dict[str, Any]) -> str:
     """Categorize vocal quality"""
@@ -7,14 +7,72 @@ import subprocess
 import json
 import tempfile
 import os
+import copy
 import logging
 import platform
+import plistlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# First stdout line of a successful generate_preset() call, followed by the written preset path
+GENERATED_PRESET_PREFIX = "✅ Generated preset: "
+
+# Upper bound on concurrent aupresetgen processes in generate_presets_batch() (one per plugin in a full chain)
+_MAX_BATCH_WORKERS = 8
+
+def parse_generated_preset_path(stdout: str) -> Optional[Path]:
+    """Extract the preset path reported by a successful generate_preset() call"""
+    first_line = stdout.split('\n', 1)[0]
+    if first_line.startswith(GENERATED_PRESET_PREFIX):
+        return Path(first_line[len(GENERATED_PRESET_PREFIX):])
+    return None
+
+def _resolve_seed(seeds_dir: Path, plugin_name: str) -> Optional[Path]:
+    """Search seeds_dir for the seed file of a plugin"""
+    # Updated plugin name to seed file mapping (fixed from current_work context)
+    # The actual files have "Seed" suffix, but some may have been renamed
+    seed_mapping = {
+        "TDR Nova": ["TDRNova.aupreset", "TDRNovaSeed.aupreset"],
+        "MEqualizer": ["MEqualizer.aupreset", "MEqualizerSeed.aupreset"],
+        "MCompressor": ["MCompressor.aupreset", "MCompressorSeed.aupreset"],
+        "1176 Compressor": ["1176Compressor.aupreset", "1176CompressorSeed.aupreset"],
+        "MAutoPitch": ["MAutoPitch.aupreset", "MAutoPitchSeed.aupreset"],
+        "Graillon 3": ["Graillon3.aupreset", "Graillon3Seed.aupreset"],
+        "Fresh Air": ["FreshAir.aupreset", "FreshAirSeed.aupreset"],
+        "LA-LA": ["LALA.aupreset", "LALASeed.aupreset"],  # Note: LALA vs LA-LA
+        "MConvolutionEZ": ["MConvolutionEZ.aupreset", "MConvolutionEZSeed.aupreset"]
+    }
+    
+    # Get possible seed filenames for this plugin
+    possible_names = seed_mapping.get(plugin_name, [])
+    
+    # Add some automatic variations if not in mapping
+    if not possible_names:
+        base_name = plugin_name.replace(' ', '').replace('-', '')
+        possible_names = [
+            f"{base_name}.aupreset",
+            f"{base_name}Seed.aupreset",
+            f"{plugin_name}.aupreset",
+            f"{plugin_name}Seed.aupreset",
+            f"{plugin_name.replace(' ', '_')}.aupreset",
+            f"{plugin_name.replace(' ', '_')}Seed.aupreset"
+        ]
+    
+    # Search for seed file
+    for seed_filename in possible_names:
+        seed_path = seeds_dir / seed_filename
+        
+        if seed_path.exists():
+            if seed_filename != possible_names[0]:  # Log if using fallback name
+                logger.info(f"Found seed file for {plugin_name}: {seed_filename}")
+            return seed_path
+    
+    return None
+
 class AUPresetGenerator:
     def __init__(self, aupresetgen_path: Optional[str] = None, seeds_dir: Optional[str] = None):
         """
@@ -47,6 +105,15 @@ class AUPresetGenerator:
         # Per-plugin path configuration
         self.plugin_paths = self._load_plugin_paths()
         
+        # Resolved seed files keyed by (seeds dir, plugin name); misses are never stored
+        self._seed_paths: Dict[Tuple[str, str], Path] = {}
+        
+        # Parsed --discover / --list-params output, keyed by _seed_query_key()
+        self._seed_queries: Dict[Tuple[str, str, str, int], Dict[str, Any]] = {}
+        
+        # Last check_available() result, keyed on (CLI path, executable mtime)
+        self._availability: Optional[Tuple[Tuple[str, Optional[int]], bool]] = None
+        
         logger.info(f"AU Preset Generator initialized:")
         logger.info(f"  Platform: {'macOS' if self.is_macos else 'Linux'}")
         logger.info(f"  Container: {self.is_container}")
@@ -239,8 +306,9 @@ class AUPresetGenerator:
         # Create values JSON file in enhanced Swift CLI format
         values_data = {"params": temp_values}
         
+        # The CLI only reads values from a file path; compact JSON keeps the handoff small
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(values_data, f, indent=2)
+            json.dump(values_data, f, separators=(',', ':'))
             values_path = f.name
         
         try:
@@ -294,35 +362,26 @@ class AUPresetGenerator:
             
             success = result.returncode == 0
             
-            # Enhanced file system debugging
-            logger.info(f"\n🔍 FILE SYSTEM DEBUG for {plugin_name}:")
-            logger.info(f"  Output directory: {output_dir}")
-            logger.info(f"  Directory exists: {os.path.exists(output_dir)}")
-            
-            if os.path.exists(output_dir):
-                # List all files in output directory
+            # Enhanced file system debugging - walks the whole output tree, so DEBUG only
+            if logger.isEnabledFor(logging.DEBUG) and os.path.exists(output_dir):
+                logger.debug(f"\n🔍 FILE SYSTEM DEBUG for {plugin_name}:")
+                logger.debug(f"  Output directory: {output_dir}")
+                
+                # Single pass: list all files and pick out the .aupreset ones
                 try:
                     all_files = []
+                    aupreset_files = []
                     for root, dirs, files in os.walk(output_dir):
                         for file in files:
                             full_path = os.path.join(root, file)
                             file_size = os.path.getsize(full_path)
                             rel_path = os.path.relpath(full_path, output_dir)
                             all_files.append(f"{rel_path} ({file_size} bytes)")
-                    
-                    logger.info(f"  All files in output dir: {all_files}")
-                    
-                    # Specific search for aupreset files
-                    aupreset_files = []
-                    for root, dirs, files in os.walk(output_dir):
-                        for file in files:
                             if file.endswith('.aupreset'):
-                                full_path = os.path.join(root, file)
-                                file_size = os.path.getsize(full_path)
-                                rel_path = os.path.relpath(full_path, output_dir)
                                 aupreset_files.append(f"{rel_path} ({file_size} bytes)")
                     
-                    logger.info(f"  .aupreset files found: {aupreset_files}")
+                    logger.debug(f"  All files in output dir: {all_files}")
+                    logger.debug(f"  .aupreset files found: {aupreset_files}")
                     
                 except Exception as fs_error:
                     logger.error(f"  Error listing files: {fs_error}")
@@ -347,7 +406,7 @@ class AUPresetGenerator:
                     if preset_path.exists():
                         if verbose:
                             logger.info(f"✅ Enhanced Swift CLI: Successfully generated preset for {plugin_name}")
-                        return True, f"✅ Generated preset: {preset_path}\nSTDOUT: {result.stdout}", ""
+                        return True, f"{GENERATED_PRESET_PREFIX}{preset_path}\nSTDOUT: {result.stdout}", ""
                 
                 logger.error(f"❌ No preset file found after generation for {plugin_name}")
                 return False, result.stdout, "No preset file found after generation"
@@ -357,9 +416,11 @@ class AUPresetGenerator:
                 
         finally:
             # Cleanup temporary files
-            if os.path.exists(values_path):
+            try:
                 os.unlink(values_path)
                 logger.info(f"  Cleaned up values file: {values_path}")
+            except FileNotFoundError:
+                pass
 
     def _convert_parameters_for_swift_cli(
         self, plugin_name: str, parameters: Dict[str, Any], parameter_map: Optional[Dict[str, str]]
@@ -638,10 +699,7 @@ class AUPresetGenerator:
         """Extract component identifiers from seed .aupreset file"""
         try:
             with open(seed_file, 'rb') as f:
-                plist_data = f.read()
-            
-            import plistlib
-            plist = plistlib.loads(plist_data)
+                plist = plistlib.load(f)
             
             # Extract component info
             manufacturer = plist.get('manufacturer', 0)
@@ -697,7 +755,7 @@ class AUPresetGenerator:
             # Create temporary values file for Python CLI
             temp_values_path = aupreset_dir / f"temp_values_{plugin_name.replace(' ', '_')}.json"
             with open(temp_values_path, 'w') as f:
-                json.dump(values_data, f, indent=2)
+                json.dump(values_data, f, separators=(',', ':'))
             
             # Look for parameter map file
             map_file = f"{plugin_name.replace(' ', '').replace('-', '')}.map.json"
@@ -765,7 +823,7 @@ class AUPresetGenerator:
                         if verbose:
                             logger.info(f"✅ Python fallback: Successfully generated preset for {plugin_name}")
                         
-                        return True, f"✅ Generated preset: {target_file}", ""
+                        return True, f"{GENERATED_PRESET_PREFIX}{target_file}", ""
                     else:
                         return False, "", "No .aupreset files generated"
                 else:
@@ -773,13 +831,32 @@ class AUPresetGenerator:
                     return False, result.stdout, result.stderr
                     
             finally:
-                if temp_values_path.exists():
-                    temp_values_path.unlink()
+                temp_values_path.unlink(missing_ok=True)
                     
         except Exception as e:
             logger.error(f"Python fallback error for {plugin_name}: {str(e)}")
             return False, "", str(e)
     
+    def generate_presets_batch(self, jobs: List[Dict[str, Any]]) -> List[Tuple[bool, str, str]]:
+        """
+        Generate several presets, overlapping the Swift CLI runs
+        
+        Args:
+            jobs: generate_preset() keyword arguments, one dict per preset
+            
+        Returns:
+            List of (success, stdout, stderr) tuples, in job order
+        """
+        # The Python fallback copies the first .aupreset it finds in the output
+        # directory, so it only stays correct when presets are written one at a time
+        if len(jobs) < 2 or not self.check_available():
+            return [self.generate_preset(**job) for job in jobs]
+        
+        # Each job blocks on its own aupresetgen process, so threads run them side by side
+        with ThreadPoolExecutor(max_workers=min(_MAX_BATCH_WORKERS, len(jobs))) as executor:
+            futures = [executor.submit(self.generate_preset, **job) for job in jobs]
+            return [future.result() for future in futures]
+    
     def discover_plugin_info(self, plugin_name: str) -> Optional[Dict[str, Any]]:
         """
         Discover plugin information from seed file
@@ -795,6 +872,11 @@ class AUPresetGenerator:
             if not seed_file:
                 return None
             
+            cache_key = self._seed_query_key("--discover", seed_file)
+            cached = self._seed_queries.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            
             cmd = [
                 self.aupresetgen_path,
                 "--seed", str(seed_file),
@@ -811,7 +893,8 @@ class AUPresetGenerator:
                     if ':' in line:
                         key, value = line.split(':', 1)
                         info[key.strip()] = value.strip()
-                return info
+                self._seed_queries[cache_key] = info
+                return copy.deepcopy(info)
             
         except Exception as e:
             logger.error(f"Failed to discover plugin info: {e}")
@@ -833,6 +916,11 @@ class AUPresetGenerator:
             if not seed_file:
                 return None
             
+            cache_key = self._seed_query_key("--list-params", seed_file)
+            cached = self._seed_queries.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            
             cmd = [
                 self.aupresetgen_path,
                 "--seed", str(seed_file),
@@ -870,53 +958,33 @@ class AUPresetGenerator:
                             else:
                                 parameters[param_id] = {'name': rest}
                 
-                return parameters
+                self._seed_queries[cache_key] = parameters
+                return copy.deepcopy(parameters)
             
         except Exception as e:
             logger.error(f"Failed to list parameters: {e}")
         
         return None
     
+    def _seed_query_key(self, query: str, seed_file: Path) -> Tuple[str, str, str, int]:
+        """Cache key for a CLI seed query; a rebuilt seed or reconfigured CLI gets a fresh entry"""
+        return (query, self.aupresetgen_path, str(seed_file), seed_file.stat().st_mtime_ns)
+    
     def _find_seed_file(self, plugin_name: str) -> Optional[Path]:
         """Find seed file for the given plugin name with corrected mapping"""
-        
-        # Updated plugin name to seed file mapping (fixed from current_work context)
-        # The actual files have "Seed" suffix, but some may have been renamed
-        seed_mapping = {
-            "TDR Nova": ["TDRNova.aupreset", "TDRNovaSeed.aupreset"],
-            "MEqualizer": ["MEqualizer.aupreset", "MEqualizerSeed.aupreset"],
-            "MCompressor": ["MCompressor.aupreset", "MCompressorSeed.aupreset"],
-            "1176 Compressor": ["1176Compressor.aupreset", "1176CompressorSeed.aupreset"],
-            "MAutoPitch": ["MAutoPitch.aupreset", "MAutoPitchSeed.aupreset"],
-            "Graillon 3": ["Graillon3.aupreset", "Graillon3Seed.aupreset"],
-            "Fresh Air": ["FreshAir.aupreset", "FreshAirSeed.aupreset"],
-            "LA-LA": ["LALA.aupreset", "LALASeed.aupreset"],  # Note: LALA vs LA-LA
-            "MConvolutionEZ": ["MConvolutionEZ.aupreset", "MConvolutionEZSeed.aupreset"]
-        }
-        
-        # Get possible seed filenames for this plugin
-        possible_names = seed_mapping.get(plugin_name, [])
-        
-        # Add some automatic variations if not in mapping
-        if not possible_names:
-            base_name = plugin_name.replace(' ', '').replace('-', '')
-            possible_names = [
-                f"{base_name}.aupreset",
-                f"{base_name}Seed.aupreset",
-                f"{plugin_name}.aupreset",
-                f"{plugin_name}Seed.aupreset",
-                f"{plugin_name.replace(' ', '_')}.aupreset",
-                f"{plugin_name.replace(' ', '_')}Seed.aupreset"
-            ]
-        
-        # Search for seed file
-        for seed_filename in possible_names:
-            seed_path = self.seeds_dir / seed_filename
-            
+        cache_key = (str(self.seeds_dir), plugin_name)
+        seed_path = self._seed_paths.get(cache_key)
+        if seed_path is not None:
             if seed_path.exists():
-                if seed_filename != possible_names[0]:  # Log if using fallback name
-                    logger.info(f"Found seed file for {plugin_name}: {seed_filename}")
                 return seed_path
+            # Seed was removed or renamed since it was resolved - search again
+            self._seed_paths.pop(cache_key, None)
+        
+        # Only hits are remembered, so a seed added while the server runs is still found
+        seed_path = _resolve_seed(self.seeds_dir, plugin_name)
+        if seed_path is not None:
+            self._seed_paths[cache_key] = seed_path
+            return seed_path
         
         # If not found, list available files for debugging
         if self.seeds_dir.exists():
@@ -1034,6 +1102,7 @@ class AUPresetGenerator:
             with tempfile.TemporaryDirectory() as temp_dir:
                 generated_presets = []
                 errors = []
+                preset_jobs = []
                 
                 # DEBUG: Log all received plugins
                 logger.info(f"🔍 DEBUG generate_chain_zip: Received {len(plugins_data)} plugins:")
@@ -1228,17 +1297,24 @@ class AUPresetGenerator:
                     converted_params = convert_parameters(parameters, plugin_name)
                     logger.info(f"✓ DEBUG: Converted {len(converted_params)} parameters for {plugin_name}")
                     
-                    # Generate individual preset (disable cleanup during chain generation)
-                    logger.info(f"🚀 DEBUG: Calling generate_preset for {plugin_name}")
+                    # Queue individual preset (disable cleanup during chain generation)
+                    logger.info(f"🚀 DEBUG: Queueing generate_preset for {plugin_name}")
                     logger.info(f"  Parameters being passed: {list(converted_params.keys())} ({len(converted_params)} total)")
                     
-                    success, stdout, stderr = self.generate_preset(
-                        plugin_name=plugin_name,
-                        parameters=converted_params,
-                        preset_name=preset_name,
-                        output_dir=temp_dir,
-                        verbose=verbose
-                    )
+                    preset_jobs.append({
+                        'plugin_name': plugin_name,
+                        'parameters': converted_params,
+                        'preset_name': preset_name,
+                        'output_dir': temp_dir,
+                        'verbose': verbose
+                    })
+                
+                # Plugins are independent, so generate them as one batch
+                results = self.generate_presets_batch(preset_jobs)
+                
+                for job, (success, stdout, stderr) in zip(preset_jobs, results):
+                    plugin_name = job['plugin_name']
+                    preset_name = job['preset_name']
                     
                     logger.info(f"📝 DEBUG: generate_preset result for {plugin_name}: success={success}")
                     if stdout:
@@ -1448,6 +1524,21 @@ PRESET FILES INCLUDED:
 
     def check_available(self) -> bool:
         """Check if the aupresetgen CLI is available and working"""
+        # Probing spawns the CLI, so reuse the last answer until the path is
+        # reconfigured or the executable is rebuilt
+        try:
+            probe_key = (self.aupresetgen_path, os.stat(self.aupresetgen_path).st_mtime_ns)
+        except OSError:
+            probe_key = (self.aupresetgen_path, None)
+        if self._availability is not None and self._availability[0] == probe_key:
+            return self._availability[1]
+        
+        available = self._probe_cli()
+        self._availability = (probe_key, available)
+        return available
+    
+    def _probe_cli(self) -> bool:
+        """Run the aupresetgen CLI once to see whether it is the real tool"""
         try:
             result = subprocess.run(
                 [self.aupresetgen_path, "--help"], 
@@ -1472,6 +1563,10 @@ def generate_au_preset(plugin_name: str, parameters: Dict[str, Any], preset_name
     """Generate AU preset using the Swift CLI tool"""
     return au_preset_generator.generate_preset(plugin_name, parameters, preset_name, output_dir, verbose=True)
 
+def generate_au_presets_batch(jobs: List[Dict[str, Any]]) -> List[Tuple[bool, str, str]]:
+    """Generate several AU presets, running the Swift CLI calls concurrently"""
+    return au_preset_generator.generate_presets_batch(jobs)
+
 def discover_au_plugin(plugin_name: str) -> Optional[Dict[str, Any]]:
     """Discover AU plugin information"""
     return au_preset_generator.discover_plugin_info(plugin_name)
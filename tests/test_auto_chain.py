@@ -6,7 +6,10 @@ import sys
 import os
 import pytest
 import asyncio
+import copy
+import plistlib
 import tempfile
+import threading
 import numpy as np
 import soundfile as sf
 from pathlib import Path
@@ -17,9 +20,17 @@ sys.path.append('/app/backend')
 
 from app.services.download import fetch_to_wav
 from app.services.analyze import analyze_audio
-from app.services.recommend import recommend_chain
+from app.services.recommend import (
+    recommend_chain, recommend_chain_batch, professional_parameter_mapping,
+    _extract_features, _recommend_1176, _recommend_lala, _recommend_fresh_air,
+    _recommend_mcompressor, _recommend_convolution, LEGACY_PLUGIN_ALIASES
+)
 from app.services.graillon_keymap import scale_mask
 from app.services.presets_bridge import PresetsBridge
+from app.services import presets_converters as converters
+from export.au_preset_generator import (
+    AUPresetGenerator, GENERATED_PRESET_PREFIX, au_preset_generator, generate_au_presets_batch
+)
 from app.core.config import settings
 
 class TestAudioGeneration:
@@ -61,6 +72,54 @@ class TestAudioGeneration:
             sf.write(tmp.name, signal, sample_rate)
             return Path(tmp.name)
 
+def make_mock_analysis(**overrides) -> dict:
+    """Mock analyze_audio() result for a clean, stable vocal; keyword overrides replace top-level fields"""
+    analysis = {
+        'bpm': 120.0,
+        'key': {'tonic': 'C', 'mode': 'major', 'confidence': 0.8},
+        'lufs_i': -18.0,
+        'lufs_s': -16.0,
+        'rms': -20.0,
+        'peak_dbfs': -6.0,
+        'crest_db': 12.0,
+        'bands': {
+            'rumble': 0.05,
+            'mud': 0.3,
+            'boxy': 0.2,
+            'harsh': 0.2,
+            'sibilance': 0.3
+        },
+        'spectral_tilt': -0.5,
+        'reverb_tail_s': 0.8,
+        'vocal': {
+            'present': True,
+            'sibilance_idx': 0.03,
+            'plosive_idx': 0.02,
+            'note_stability': 0.9
+        }
+    }
+    analysis.update(overrides)
+    return analysis
+
+class FakePresetGenerator:
+    """Stand-in for AUPresetGenerator that writes each parameter set to a small plist preset"""
+    
+    def __init__(self, available: bool = True):
+        self.available = available
+        self.calls = []
+    
+    def check_available(self):
+        return self.available
+    
+    def generate_preset(self, plugin_name, parameters, preset_name, output_dir, verbose=False, **kwargs):
+        self.calls.append(plugin_name)
+        preset_file = Path(output_dir) / f"{preset_name}.aupreset"
+        preset_file.write_bytes(plistlib.dumps({
+            'name': preset_name,
+            'data': repr(sorted(parameters.items()))
+        }))
+        return True, f"{GENERATED_PRESET_PREFIX}{preset_file}", ""
+
 class TestDownloadService:
     """Test the download service"""
     
@@ -308,6 +367,429 @@ class TestPresetsBridge:
             assert params['attack'] == 0.5  # medium
             assert params['release'] == 0.5  # medium
 
+class TestPresetCache:
+    """Test the generated-preset cache in PresetsBridge"""
+    
+    def test_identical_targets_replay_cached_presets(self):
+        """Identical targets reuse the cached presets under the new chain name"""
+        generator = FakePresetGenerator()
+        bridge = PresetsBridge(generator=generator)
+        targets = recommend_chain(make_mock_analysis())
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first = bridge.generate_presets(targets, Path(tmp_dir) / 'first', 'aaaaaaaa-0000')
+            calls = len(generator.calls)
+            second = bridge.generate_presets(targets, Path(tmp_dir) / 'second', 'bbbbbbbb-0000')
+            
+            # Nothing regenerated, same presets in the same order
+            assert calls > 0
+            assert len(generator.calls) == calls
+            assert [f.name.replace('aaaaaaaa', 'bbbbbbbb') for f in first] == [f.name for f in second]
+            
+            for first_file, second_file in zip(first, second):
+                first_preset = plistlib.loads(first_file.read_bytes())
+                second_preset = plistlib.loads(second_file.read_bytes())
+                assert second_preset['data'] == first_preset['data']
+                assert second_preset['name'] == first_preset['name'].replace('aaaaaaaa', 'bbbbbbbb')
+    
+    def test_replayed_presets_are_independent(self):
+        """Overwriting a replayed preset file doesn't change what later replays write"""
+        bridge = PresetsBridge(generator=FakePresetGenerator())
+        targets = recommend_chain(make_mock_analysis(crest_db=10.0))
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bridge.generate_presets(targets, Path(tmp_dir) / 'first', 'aaaaaaaa-0000')
+            replayed = bridge.generate_presets(targets, Path(tmp_dir) / 'second', 'bbbbbbbb-0000')
+            original = [f.read_bytes() for f in replayed]
+            for preset_file in replayed:
+                preset_file.write_bytes(b'corrupted')
+            
+            again = bridge.generate_presets(targets, Path(tmp_dir) / 'third', 'bbbbbbbb-0000')
+            assert [f.read_bytes() for f in again] == original
+    
+    def test_changed_targets_regenerate(self):
+        """Different targets miss the cache"""
+        generator = FakePresetGenerator()
+        bridge = PresetsBridge(generator=generator)
+        targets = recommend_chain(make_mock_analysis())
+        changed = copy.deepcopy(targets)
+        changed['professional_params']['LA-LA']['peak_reduction'] = 0.9
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bridge.generate_presets(targets, Path(tmp_dir) / 'first', 'aaaaaaaa-0000')
+            calls = len(generator.calls)
+            bridge.generate_presets(changed, Path(tmp_dir) / 'second', 'bbbbbbbb-0000')
+            assert len(generator.calls) == 2 * calls
+
+class TestConverterMemoization:
+    """Test the memoized professional converters"""
+    
+    def test_cached_result_is_a_copy(self):
+        """Mutating a converter result doesn't poison later cache hits"""
+        targets = {'ratio': '8:1', 'attack': 'Fast', 'release': 'Slow'}
+        first = converters.convert_1176_professional(targets)
+        first['Ratio'] = 99.0
+        
+        hits = converters.convert_1176_professional.cache_info().hits
+        second = converters.convert_1176_professional(dict(targets))
+        
+        assert converters.convert_1176_professional.cache_info().hits == hits + 1
+        assert second['Ratio'] == 2.0
+        assert second is not first
+    
+    def test_value_type_is_part_of_key(self):
+        """Equal values of different types don't share a cache entry"""
+        as_int = converters.convert_lala_professional({'peak_reduction': 1})
+        as_float = converters.convert_lala_professional({'peak_reduction': 1.0})
+        
+        assert type(as_int['Peak_Reduction']) is int
+        assert type(as_float['Peak_Reduction']) is float
+    
+    def test_unhashable_targets_bypass_cache(self):
+        """Targets with unhashable values are converted without caching"""
+        size = converters.convert_lala_professional.cache_info().currsize
+        params = converters.convert_lala_professional({'peak_reduction': [0.3]})
+        
+        assert params['Peak_Reduction'] == [0.3]
+        assert converters.convert_lala_professional.cache_info().currsize == size
+
+class TestRecommendationCache:
+    """Test the recommend_chain cache"""
+    
+    def test_cache_hit_is_independent_copy(self):
+        """Mutating a returned recommendation doesn't poison later cache hits"""
+        first = recommend_chain(make_mock_analysis(crest_db=13.0))
+        expected = copy.deepcopy(first)
+        
+        first['chain_style'] = 'mutated'
+        first['professional_params']['LA-LA']['peak_reduction'] = 0.99
+        first['analysis_summary'].clear()
+        
+        second = recommend_chain(make_mock_analysis(crest_db=13.0))
+        assert second == expected
+        assert second['professional_params'] is not first['professional_params']
+    
+    def test_cache_hit_keeps_legacy_aliases(self):
+        """Legacy plugin keys in a cached copy still alias their professional entries"""
+        recommend_chain(make_mock_analysis(crest_db=13.5))
+        targets = recommend_chain(make_mock_analysis(crest_db=13.5))
+        
+        for legacy, name in LEGACY_PLUGIN_ALIASES:
+            assert targets[legacy] is targets['professional_params'][name]
+    
+    def test_changed_analysis_misses_cache(self):
+        """A field recommend_chain reads changes the recommendation key"""
+        quiet = recommend_chain(make_mock_analysis(lufs_i=-30.0))
+        loud = recommend_chain(make_mock_analysis(lufs_i=-8.0))
+        
+        assert quiet['analysis_summary'] != loud['analysis_summary']
+
+class TestRecommendationBatch:
+    """Test recommend_chain_batch"""
+    
+    def test_batch_matches_single_calls(self):
+        """Batch results equal per-analysis recommend_chain results, in input order"""
+        analyses = [
+            make_mock_analysis(crest_db=8.0),
+            make_mock_analysis(crest_db=18.0, lufs_i=-12.0),
+            make_mock_analysis(spectral_tilt=0.4, reverb_tail_s=1.6),
+            make_mock_analysis(crest_db=8.0)
+        ]
+        
+        batch = recommend_chain_batch(analyses)
+        
+        assert batch == [recommend_chain(analysis) for analysis in analyses]
+    
+    def test_duplicate_analyses_are_independent(self):
+        """Identical analyses in a batch get separate copies"""
+        batch = recommend_chain_batch([make_mock_analysis(bpm=95.0), make_mock_analysis(bpm=95.0)])
+        expected = copy.deepcopy(batch[1])
+        
+        batch[0]['professional_params']['LA-LA']['peak_reduction'] = 0.99
+        batch[0]['chain_style'] = 'mutated'
+        
+        assert batch[1] == expected
+    
+    def test_empty_batch(self):
+        """An empty batch returns an empty list"""
+        assert recommend_chain_batch([]) == []
+
+class TestProfessionalMappingTables:
+    """Test the per-gender / per-style lookups in professional_parameter_mapping"""
+    
+    STYLES = ('clean', 'pop-airy', 'warm-analog', 'aggressive-rap', 'intimate-rnb', 'balanced')
+    
+    @staticmethod
+    def map_for(chain_style: str, **vocal) -> dict:
+        analysis = make_mock_analysis()
+        analysis['vocal'].update(vocal)
+        return professional_parameter_mapping(_extract_features(analysis), chain_style)
+    
+    def test_hpf_by_gender(self):
+        """HPF base follows the gender profile, with a middle ground when unknown"""
+        for gender, hpf in (('male', 75), ('female', 95), ('unknown', 85)):
+            assert self.map_for('clean', gender_profile=gender)['TDR Nova']['hpf_freq'] == hpf
+    
+    def test_style_lookups(self):
+        """Style-only choices match the original per-style branches"""
+        expected = {
+            # style: (1176 attack, reverb mix, air shelf (freq, gain), preserve formants)
+            'clean': ('Medium-Fast', 0.12, (11000, 1.2), True),
+            'pop-airy': ('Medium-Fast', 0.12, (10000, 1.8), False),
+            'warm-analog': ('Medium-Fast', 0.20, (11000, 1.2), False),
+            'aggressive-rap': ('Medium-Fast', 0.08, (11000, 1.2), False),
+            'intimate-rnb': ('Medium', 0.15, (12000, 0.8), True),
+            'balanced': ('Medium-Fast', 0.12, (11000, 1.2), False)
+        }
+        for style in self.STYLES:
+            targets = self.map_for(style, gender_profile='male')
+            attack, reverb_mix, air_shelf, preserve_formants = expected[style]
+            
+            assert targets['1176 Compressor']['attack'] == attack, style
+            assert targets['MConvolutionEZ']['mix'] == pytest.approx(reverb_mix), style
+            assert (targets['MEqualizer']['air_freq'], targets['MEqualizer']['air_gain']) == air_shelf, style
+            assert targets['Graillon 3']['preserve_formants'] == preserve_formants, style
+    
+    def test_plosives_force_fast_attack(self):
+        """Heavy plosives override the style's 1176 attack"""
+        for style in self.STYLES:
+            assert self.map_for(style, plosive_index=0.5)['1176 Compressor']['attack'] == 'Fast'
+
+class TestLegacyRecommenders:
+    """Test the table-driven legacy _recommend_* helpers against the original branch outputs"""
+    
+    STYLES = ('clean', 'pop-airy', 'warm-analog', 'aggressive-rap', 'intimate-rnb', 'balanced')
+    
+    def test_mcompressor_by_style(self):
+        """Glue compression is off for clean chains, otherwise ratio/timing follow the style"""
+        expected = {
+            'clean': None,
+            'pop-airy': (1.8, 30, 150),
+            'warm-analog': (1.8, 30, 150),
+            'aggressive-rap': (2.2, 30, 150),
+            'intimate-rnb': (1.8, 50, 200),
+            'balanced': (1.8, 30, 150)
+        }
+        for style in self.STYLES:
+            params = _recommend_mcompressor(make_mock_analysis(), style)
+            if expected[style] is None:
+                assert params['enabled'] is False
+                continue
+            assert (params['ratio'], params['attack_ms'], params['release_ms']) == expected[style], style
+    
+    def test_convolution_reverb_tail_boundaries(self):
+        """IR switches below a 0.5s tail, and wet drops only above a 1.0s tail"""
+        expected = {
+            # style: (IR below 0.5s, IR from 0.5s, wet, pre-delay)
+            'clean': ('medium_plate', 'medium_plate', 0.10, 15),
+            'pop-airy': ('medium_plate', 'medium_plate', 0.10, 15),
+            'warm-analog': ('vintage_plate', 'vintage_plate', 0.10, 15),
+            'aggressive-rap': ('small_plate', 'small_plate', 0.08, 5),
+            'intimate-rnb': ('small_hall', 'medium_hall', 0.12, 15),
+            'balanced': ('medium_plate', 'medium_plate', 0.10, 15)
+        }
+        for style in self.STYLES:
+            short_ir, long_ir, wet, pre_delay = expected[style]
+            for tail, ir_type, wet_scale in ((0.49, short_ir, 1.0), (0.5, long_ir, 1.0),
+                                             (1.0, long_ir, 1.0), (1.01, long_ir, 0.7)):
+                params = _recommend_convolution(make_mock_analysis(reverb_tail_s=tail), style)
+                assert params['ir_type'] == ir_type, (style, tail)
+                assert params['wet'] == pytest.approx(wet * wet_scale), (style, tail)
+                assert params['pre_delay_ms'] == pre_delay, style
+    
+    def test_fresh_air_tilt_boundaries(self):
+        """Only pop-airy backs off for positive tilt; tilt <= 0 keeps the base amounts"""
+        expected = {
+            'clean': (0.25, 0.15),
+            'pop-airy': (0.4, 0.3),
+            'warm-analog': (0.15, 0.1),
+            'aggressive-rap': (0.3, 0.2),
+            'intimate-rnb': (0.25, 0.15),
+            'balanced': (0.25, 0.15)
+        }
+        for style in self.STYLES:
+            presence, brilliance = expected[style]
+            for tilt in (-0.5, 0.0):
+                params = _recommend_fresh_air(make_mock_analysis(spectral_tilt=tilt), style)
+                assert params['presence'] == pytest.approx(presence), (style, tilt)
+                assert params['brilliance'] == pytest.approx(brilliance), (style, tilt)
+            
+            params = _recommend_fresh_air(make_mock_analysis(spectral_tilt=0.5), style)
+            if style == 'pop-airy':
+                assert params['presence'] == pytest.approx(0.3)
+                assert params['brilliance'] == pytest.approx(0.225)
+            else:
+                assert params['presence'] == pytest.approx(presence), style
+                assert params['brilliance'] == pytest.approx(brilliance), style
+    
+    def test_fresh_air_sibilance_cap(self):
+        """Sibilance above the threshold scales both amounts down proportionally"""
+        analysis = make_mock_analysis(spectral_tilt=0.0)
+        analysis['bands']['sibilance'] = settings.SIBILANCE_THRESHOLD * 2
+        params = _recommend_fresh_air(analysis, 'pop-airy')
+        
+        assert params['presence'] == pytest.approx(0.2)
+        assert params['brilliance'] == pytest.approx(0.15)
+        assert params['enabled'] is True
+    
+    def test_1176_crest_boundaries(self):
+        """Ratio, timing and gain reduction switch strictly above their crest thresholds"""
+        high_crest = settings.HIGH_CREST_THRESHOLD
+        cases = [
+            # (style, crest, ratio, attack, release, target_gr_db)
+            ('aggressive-rap', 12.0, '4:1', 'fast', 'fast', 3),
+            ('aggressive-rap', 15.0, '4:1', 'fast', 'fast', 5),
+            ('aggressive-rap', 15.5, '8:1', 'fast', 'fast', 5),
+            ('intimate-rnb', 12.0, '4:1', 'medium', 'slow', 3),
+            ('intimate-rnb', high_crest, '4:1', 'medium', 'slow', 5),
+            ('intimate-rnb', 16.5, '4:1', 'fast', 'fast', 7),
+            ('clean', 12.0, '2:1', 'medium', 'medium', 3),
+            ('clean', 12.5, '4:1', 'medium', 'medium', 5),
+            ('pop-airy', high_crest, '4:1', 'medium', 'medium', 5),
+            ('pop-airy', high_crest + 0.5, '4:1', 'fast', 'fast', 5),
+            ('warm-analog', 16.0, '4:1', 'fast', 'fast', 5),
+            ('balanced', 16.5, '4:1', 'fast', 'fast', 7)
+        ]
+        for style, crest, ratio, attack, release, target_gr_db in cases:
+            params = _recommend_1176(make_mock_analysis(crest_db=crest), style)
+            assert (params['ratio'], params['attack'], params['release']) == (ratio, attack, release), (style, crest)
+            assert params['target_gr_db'] == target_gr_db, (style, crest)
+            assert params['output_gain_db'] == target_gr_db - 1
+    
+    def test_1176_disabled_without_vocal(self):
+        """No vocal means no 1176"""
+        analysis = make_mock_analysis()
+        analysis['vocal']['present'] = False
+        
+        assert _recommend_1176(analysis, 'aggressive-rap')['enabled'] is False
+    
+    def test_lala_by_style(self):
+        """LA-LA leveling amount and mode follow the style"""
+        expected = {
+            'clean': (2, 'medium'),
+            'pop-airy': (2, 'medium'),
+            'warm-analog': (3, 'gentle'),
+            'aggressive-rap': (2, 'fast'),
+            'intimate-rnb': (3, 'gentle'),
+            'balanced': (2, 'medium')
+        }
+        for style in self.STYLES:
+            params = _recommend_lala(make_mock_analysis(), style)
+            assert (params['target_gr_db'], params['mode']) == expected[style], style
+
+class TestProfessionalMappingCache:
+    """Test the memoized professional_parameter_mapping"""
+    
+    def test_cache_hit_is_independent_copy(self):
+        """Mutating a mapping result doesn't poison later cache hits"""
+        features = _extract_features(make_mock_analysis(bpm=101.0))
+        first = professional_parameter_mapping(features, 'pop-airy')
+        expected = copy.deepcopy(first)
+        
+        first['MEqualizer']['air_gain'] = 99.0
+        first['Graillon 3']['scale_mask'].append(7)
+        del first['LA-LA']
+        
+        assert professional_parameter_mapping(features, 'pop-airy') == expected
+    
+    def test_style_is_part_of_key(self):
+        """The same features map differently per chain style"""
+        features = _extract_features(make_mock_analysis(bpm=101.0))
+        
+        pop = professional_parameter_mapping(features, 'pop-airy')
+        rnb = professional_parameter_mapping(features, 'intimate-rnb')
+        
+        assert pop['MEqualizer']['air_freq'] == 10000
+        assert rnb['MEqualizer']['air_freq'] == 12000
+    
+    def test_value_type_is_part_of_key(self):
+        """Features equal only up to int/float don't share a cache entry"""
+        as_int = make_mock_analysis(bpm=99.0)
+        as_int['vocal'].update(mud_ratio=0, nasal_ratio=1)
+        as_float = make_mock_analysis(bpm=99.0)
+        as_float['vocal'].update(mud_ratio=0.0, nasal_ratio=1.0)
+        
+        professional_parameter_mapping(_extract_features(as_int), 'clean')
+        tdr_nova = professional_parameter_mapping(_extract_features(as_float), 'clean')['TDR Nova']
+        
+        assert type(tdr_nova['mud_center']) is float
+        assert type(tdr_nova['nasal_center']) is float
+
+class TestPresetBatch:
+    """Test AUPresetGenerator.generate_presets_batch and generate_au_presets_batch"""
+    
+    PLUGINS = ('MEqualizer', 'TDR Nova', '1176 Compressor', 'LA-LA', 'Fresh Air')
+    
+    @staticmethod
+    def fake_generate(plugin_name, parameters, preset_name, output_dir=None, parameter_map=None, verbose=False):
+        return True, f"{preset_name}:{plugin_name}:{sorted(parameters.items())}", ""
+    
+    def make_jobs(self, output_dir: str) -> list:
+        return [
+            {'plugin_name': plugin, 'parameters': {'gain': float(i)}, 'preset_name': f"Chain_{i}", 'output_dir': output_dir}
+            for i, plugin in enumerate(self.PLUGINS)
+        ]
+    
+    def test_batch_matches_single_calls(self):
+        """Batch results equal per-job generate_preset results, in job order"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            generator = AUPresetGenerator(aupresetgen_path=str(Path(tmp_dir) / 'aupresetgen'), seeds_dir=tmp_dir)
+            jobs = self.make_jobs(tmp_dir)
+            
+            with patch.object(generator, 'check_available', return_value=True), \
+                 patch.object(generator, 'generate_preset', side_effect=self.fake_generate):
+                batch = generator.generate_presets_batch(jobs)
+                singles = [generator.generate_preset(**job) for job in jobs]
+            
+            assert batch == singles
+    
+    def test_batch_runs_concurrently_with_swift_cli(self):
+        """With the Swift CLI available every job is in flight at once"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            generator = AUPresetGenerator(aupresetgen_path=str(Path(tmp_dir) / 'aupresetgen'), seeds_dir=tmp_dir)
+            jobs = self.make_jobs(tmp_dir)
+            # Each job waits for all the others - a sequential batch would break the barrier
+            barrier = threading.Barrier(len(jobs), timeout=10)
+            
+            def generate(**job):
+                barrier.wait()
+                return self.fake_generate(**job)
+            
+            with patch.object(generator, 'check_available', return_value=True), \
+                 patch.object(generator, 'generate_preset', side_effect=generate):
+                results = generator.generate_presets_batch(jobs)
+            
+            assert [success for success, _, _ in results] == [True] * len(jobs)
+    
+    def test_batch_is_sequential_with_python_fallback(self):
+        """Without the Swift CLI, jobs run one at a time on the calling thread"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            generator = AUPresetGenerator(aupresetgen_path=str(Path(tmp_dir) / 'aupresetgen'), seeds_dir=tmp_dir)
+            jobs = self.make_jobs(tmp_dir)
+            threads = []
+            
+            def generate(**job):
+                threads.append(threading.current_thread())
+                return self.fake_generate(**job)
+            
+            with patch.object(generator, 'check_available', return_value=False), \
+                 patch.object(generator, 'generate_preset', side_effect=generate):
+                results = generator.generate_presets_batch(jobs)
+            
+            assert threads == [threading.current_thread()] * len(jobs)
+            assert results == [self.fake_generate(**job) for job in jobs]
+    
+    def test_module_level_batch(self):
+        """generate_au_presets_batch uses the global generator and keeps job order"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            jobs = self.make_jobs(tmp_dir)
+            
+            with patch.object(au_preset_generator, 'check_available', return_value=True), \
+                 patch.object(au_preset_generator, 'generate_preset', side_effect=self.fake_generate):
+                results = generate_au_presets_batch(jobs)
+            
+            assert results == [self.fake_generate(**job) for job in jobs]
+
 # Test runner functions
 def run_unit_tests():
     """Run all unit tests"""
@@ -319,7 +801,15 @@ def run_unit_tests():
         TestAnalysisService(), 
         TestRecommendationService(),
         TestGraillonKeymap(),
-        TestPresetsBridge()
+        TestPresetsBridge(),
+        TestPresetCache(),
+        TestConverterMemoization(),
+        TestRecommendationCache(),
+        TestRecommendationBatch(),
+        TestProfessionalMappingTables(),
+        TestLegacyRecommenders(),
+        TestProfessionalMappingCache(),
+        TestPresetBatch()
     ]
     
     total_tests = 0